@@ -60,6 +60,7 @@ class DirectionalGridBot:
         self.filled_order_ids = set()  # Track IDs of filled orders
         self.running = False
         self.has_initial_position = False
+        self.initial_position_price = 0.0
         
         # Calculate current price
         self.current_price = self._get_current_price()
@@ -205,6 +206,7 @@ class DirectionalGridBot:
             if result:
                 logger.info(f"Initial position placed successfully: {result}")
                 self.has_initial_position = True
+                self.initial_position_price = price
                 
                 # Add to tracking
                 self.active_positions[result] = {
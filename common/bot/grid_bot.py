@@ -34,7 +34,10 @@ class GridBot:
         self.running = False
         self.grid_orders = []
         self.filled_orders = []
-        self.active_positions = []
+        # Running total of profit from fills, kept up to date by handle_order_fill
+        self.realized_profit = 0.0
+        self.active_positions = {}  # order_id -> order details
+        self.last_price: Optional[float] = None
     
     def start(self):
         """Start the grid trading bot."""
@@ -81,6 +84,10 @@ class GridBot:
         # Implementation of print_summary method
         pass
     
+    def on_price(self, price: float):
+        """Receive a price update pushed by the price monitor."""
+        self.last_price = price
+    
     def handle_order_fill(self, order_id: str, fill_price: float, fill_amount: float):
         """Handle order fill event."""
         if order_id not in self.active_positions:
@@ -94,6 +101,7 @@ class GridBot:
             'fill_time': datetime.now()
         })
         self.filled_orders.append(filled_order)
+        self.realized_profit += self._fill_profit(filled_order)
         
         # Create new order on opposite side
         new_order = {
@@ -116,12 +124,13 @@ class GridBot:
                 'timestamp': datetime.now()
             }
     
+    @staticmethod
+    def _fill_profit(order: Dict) -> float:
+        """Profit contributed by a single filled order."""
+        if order['side'] == 'sell':
+            return (order['fill_price'] - order['price']) * order['fill_amount']
+        return (order['price'] - order['fill_price']) * order['fill_amount']
+    
     def calculate_profit(self) -> float:
         """Calculate total profit from filled orders."""
-        total_profit = 0.0
-        for order in self.filled_orders:
-            if order['side'] == 'sell':
-                total_profit += (order['fill_price'] - order['price']) * order['fill_amount']
-            else:
-                total_profit += (order['price'] - order['fill_price']) * order['fill_amount']
-        return total_profit 
\ No newline at end of file
+        return sum(map(self._fill_profit, self.filled_orders)) 
\ No newline at end of file
@@ -4,6 +4,9 @@ from common.exchange.base_client import BaseExchangeClient
 from common.utils.logger import setup_logger
 from common.utils.symbol_info import get_symbol_info, adjust_quantity, adjust_price
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
 import time
 
 logger = setup_logger(__name__)
@@ -38,6 +41,10 @@ class PrecisionGridBot:
         self.filled_orders = []
         self.active_positions = {}  # Dict to track active positions
         
+        # Shared across placement workers: each order holds a slot for one second,
+        # so no more than GRID_ORDERS_PER_SECOND orders go out in any second
+        self._order_slots = threading.Semaphore(int(os.getenv('GRID_ORDERS_PER_SECOND', '5')))
+        
         # Get current price to calculate grid
         ticker = self.exchange.get_ticker(self.symbol)
         self.current_price = ticker["last"]
@@ -90,8 +97,8 @@ class PrecisionGridBot:
         for price in price_levels:
             logger.info(f"  - {price}")
         
-        # Place orders at each level
-        orders_placed = 0
+        # Work out which levels get an order
+        grid_orders = []
         for price in price_levels:
             # Skip if price is too close to current price (avoid immediate fills)
             if abs(price - self.current_price) / self.current_price < 0.001:
@@ -100,28 +107,50 @@ class PrecisionGridBot:
                 
             # Determine order side
             side = "buy" if price < self.current_price else "sell"
+            grid_orders.append((side, price))
+        
+        # Place the independent level orders concurrently
+        orders_placed = 0
+        if grid_orders:
+            workers = min(len(grid_orders), int(os.getenv('GRID_PARALLEL', '4')))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda order: self._place_grid_order(*order), grid_orders))
             
-            try:
-                logger.info(f"Placing {side} order: {self.order_amount} @ {price}")
-                order = self.exchange.create_order(
-                    symbol=self.symbol,
-                    side=side,
-                    amount=float(self.order_amount),
-                    price=price
-                )
-                
-                if order and "id" in order:
-                    logger.info(f"Order placed: {order['id']}")
+            for order in results:
+                if order:
                     self.active_positions[order["id"]] = order
                     orders_placed += 1
-                    time.sleep(0.5)  # Small delay to avoid rate limits
-                else:
-                    logger.error(f"Failed to place {side} order at {price}")
-            except Exception as e:
-                logger.error(f"Error placing grid order: {str(e)}")
         
         logger.info(f"Successfully placed {orders_placed} orders")
     
+    def _place_grid_order(self, side: str, price: float) -> Optional[Dict]:
+        """Place a single grid order; returns the order or None on failure."""
+        try:
+            self._acquire_order_slot()
+            logger.info(f"Placing {side} order: {self.order_amount} @ {price}")
+            order = self.exchange.create_order(
+                symbol=self.symbol,
+                side=side,
+                amount=float(self.order_amount),
+                price=price
+            )
+            
+            if order and "id" in order:
+                logger.info(f"Order placed: {order['id']}")
+                return order
+            else:
+                logger.error(f"Failed to place {side} order at {price}")
+        except Exception as e:
+            logger.error(f"Error placing grid order: {str(e)}")
+        return None
+    
+    def _acquire_order_slot(self):
+        """Block until the per-second order limit has room, then release the slot a second later."""
+        self._order_slots.acquire()
+        release = threading.Timer(1.0, self._order_slots.release)
+        release.daemon = True
+        release.start()
+    
     def cancel_all_orders(self):
         """Cancel all open orders."""
         logger.info("Cancelling all orders...")
@@ -4,6 +4,8 @@ import hmac
 import hashlib
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import uuid
 from urllib.parse import urlencode
 
@@ -13,9 +15,21 @@ from common.utils.symbol_info import get_symbol_info
 
 logger = setup_logger(__name__)
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+def _now_ms() -> int:
+    """Current local time in milliseconds."""
+    return time.time_ns() // 1_000_000
+
 class BybitClient(BaseExchangeClient):
     """Bybit exchange client implementation."""
     
+    # Orders accepted per /v5/order/create-batch request
+    MAX_BATCH_ORDERS = 10
+    
     def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
         """Initialize Bybit client with API credentials."""
         self.api_key = api_key
@@ -23,6 +37,17 @@ class BybitClient(BaseExchangeClient):
         self.testnet = testnet
         self.base_url = "https://api-testnet.bybit.com" if testnet else "https://api.bybit.com"
         
+        # Keyed HMAC prototype; copying it skips re-deriving the key pads per request
+        self._hmac_template = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        
+        # Persistent session so public, private and symbol-info calls reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.1)
+        ))
+        
         # For time synchronization
         self.time_offset = 0
         self.sync_time()  # Sync time on initialization
@@ -36,6 +61,7 @@ class BybitClient(BaseExchangeClient):
         
         # Initialize available trading pairs
         self.available_pairs = {}
+        self._symbol_categories = {}  # normalized symbol -> category
         self._get_available_trading_pairs()
         
         # Try to check connection - but continue even if it fails
@@ -50,7 +76,7 @@ class BybitClient(BaseExchangeClient):
         """Synchronize local time with Bybit server time."""
         try:
             server_time = self._get_server_time()
-            local_time = int(time.time() * 1000)
+            local_time = _now_ms()
             self.time_offset = server_time - local_time
             logger.info(f"Time offset between local and server: {self.time_offset}ms")
         except Exception as e:
@@ -59,19 +85,19 @@ class BybitClient(BaseExchangeClient):
     def _get_server_time(self):
         """Get Bybit server time."""
         try:
-            response = requests.get(f"{self.base_url}/v5/market/time")
+            response = self._session.get(f"{self.base_url}/v5/market/time")
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 if "result" in result and "timeSecond" in result["result"]:
                     return int(result["result"]["timeSecond"]) * 1000
             raise Exception("Failed to get server time")
         except Exception as e:
             logger.error(f"Error getting server time: {str(e)}")
-            return int(time.time() * 1000)  # Fallback to local time
+            return _now_ms()  # Fallback to local time
     
     def _get_timestamp(self):
         """Get current timestamp adjusted for server time offset."""
-        return int(time.time() * 1000) + self.time_offset
+        return _now_ms() + self.time_offset
     
     def _check_time_sync(self):
         """Check if local time is synchronized with server time."""
@@ -79,7 +105,7 @@ class BybitClient(BaseExchangeClient):
             response = self._get_public("/v5/market/time")
             if response and "result" in response and "timeSecond" in response["result"]:
                 server_time = int(response["result"]["timeSecond"]) * 1000
-                local_time = int(time.time() * 1000)
+                local_time = _now_ms()
                 diff = abs(local_time - server_time)
                 
                 if diff > 10000:  # If difference is more than 10 seconds
@@ -92,12 +118,9 @@ class BybitClient(BaseExchangeClient):
     
     def _generate_signature(self, params_str: str) -> str:
         """Generate signature for API request."""
-        signature = hmac.new(
-            bytes(self.api_secret, "utf-8"),
-            bytes(params_str, "utf-8"),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        mac = self._hmac_template.copy()
+        mac.update(params_str.encode("utf-8"))
+        return mac.hexdigest()
     
     def _get_public(self, endpoint: str, params: Dict = None) -> Dict:
         """Make a public GET request to Bybit API."""
@@ -106,9 +129,9 @@ class BybitClient(BaseExchangeClient):
             url += f"?{urlencode(params)}"
         
         try:
-            response = requests.get(url)
+            response = self._session.get(url)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
         except Exception as e:
             logger.error(f"Error in public request to {endpoint}: {str(e)}")
             return {}
@@ -135,11 +158,7 @@ class BybitClient(BaseExchangeClient):
                 param_str += query_string
             
             # Generate signature
-            signature = hmac.new(
-                self.api_secret.encode("utf-8"),
-                param_str.encode("utf-8"),
-                hashlib.sha256
-            ).hexdigest()
+            signature = self._generate_signature(param_str)
             
             # Set headers
             headers = {
@@ -158,14 +177,14 @@ class BybitClient(BaseExchangeClient):
             logger.info(f"API Request: GET {url}")
             logger.info(f"Request Headers: {headers}")
             
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url, headers=headers)
             
             # Debug log response
             logger.info(f"API Response Status: {response.status_code}")
             logger.info(f"API Response Content: {response.text}")
             
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             else:
                 logger.error(f"API error: {response.status_code} - {response.text}")
                 return {}
@@ -187,11 +206,7 @@ class BybitClient(BaseExchangeClient):
                 param_str = json.dumps(data)
             
             signature_payload = f"{timestamp}{self.api_key}{recv_window}{param_str}"
-            signature = hmac.new(
-                self.api_secret.encode("utf-8"),
-                signature_payload.encode("utf-8"),
-                hashlib.sha256
-            ).hexdigest()
+            signature = self._generate_signature(signature_payload)
             
             # Headers with corrected timestamp
             headers = {
@@ -208,7 +223,7 @@ class BybitClient(BaseExchangeClient):
             logger.info(f"Request Data: {data}")
             
             # Make request
-            response = requests.post(url, headers=headers, json=data)
+            response = self._session.post(url, headers=headers, json=data)
             
             # Debug log response
             logger.info(f"API Response Status: {response.status_code}")
@@ -216,7 +231,7 @@ class BybitClient(BaseExchangeClient):
             
             # Parse response
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 if result and "retCode" in result and result["retCode"] == 0:
                     return result
                 else:
@@ -248,6 +263,13 @@ class BybitClient(BaseExchangeClient):
             except Exception as e:
                 logger.error(f"Failed to fetch {category} symbols: {str(e)}")
                 self.available_pairs[category] = []
+        
+        # Resolve each symbol's category once so lookups don't scan the lists.
+        # Inverse is applied last so it wins when a symbol is listed in both.
+        self._symbol_categories = {}
+        for category in ("linear", "inverse"):
+            for pair in self.available_pairs.get(category, []):
+                self._symbol_categories[pair] = category
     
     def _detect_symbol_category(self, symbol):
         """Detect the symbol category (linear, inverse, spot, etc.)."""
@@ -262,10 +284,9 @@ class BybitClient(BaseExchangeClient):
             return "inverse"
         
         # Try to determine from available symbols
-        if normalized in self.available_pairs.get("inverse", []):
-            return "inverse"
-        elif normalized in self.available_pairs.get("linear", []):
-            return "linear"
+        category = self._symbol_categories.get(normalized)
+        if category:
+            return category
         
         # Special cases
         if normalized == "BTCUSD" or normalized.endswith("USD"):
@@ -409,13 +430,13 @@ class BybitClient(BaseExchangeClient):
                                     "total": wallet_balance
                                 }
                 
-                logger.warning(f"No balance data found for {currency}")
+                logger.warning("No balance data found for %s", currency)
                 return {"free": 0.0, "used": 0.0, "total": 0.0}
             else:
                 logger.warning("No balance data found")
                 return {"free": 0.0, "used": 0.0, "total": 0.0}
         except Exception as e:
-            logger.error(f"Error getting balance: {str(e)}")
+            logger.error("Error getting balance: %s", e)
             return {"free": 0.0, "used": 0.0, "total": 0.0}  # Return empty balance rather than empty dict
     
     def create_order(self, symbol: str, side: str, amount: float, price: float) -> Optional[Dict]:
@@ -451,10 +472,10 @@ class BybitClient(BaseExchangeClient):
                 }
             else:
                 error_msg = response.get("retMsg", "Unknown error") if response else "No response"
-                logger.error(f"Failed to create order: {error_msg}")
+                logger.error("Failed to create order: %s", error_msg)
                 return None
         except Exception as e:
-            logger.error(f"Failed to create order: {str(e)}")
+            logger.error("Failed to create order: %s", e)
             return None
     
     def cancel_all_orders(self, symbol: str) -> bool:
@@ -574,7 +595,7 @@ class BybitClient(BaseExchangeClient):
             response = self._post_private("/v5/order/cancel", data)
             
             if response and "retCode" in response and response["retCode"] == 0:
-                logger.info(f"Successfully cancelled order: {order_id}")
+                logger.info("Successfully cancelled order: %s", order_id)
                 return {
                     "id": order_id,
                     "symbol": symbol,
@@ -583,10 +604,10 @@ class BybitClient(BaseExchangeClient):
                 }
             else:
                 error_msg = response.get("retMsg", "Unknown error") if response else "No response"
-                logger.error(f"Failed to cancel order: {error_msg}")
+                logger.error("Failed to cancel order: %s", error_msg)
                 return None
         except Exception as e:
-            logger.error(f"Error cancelling order: {str(e)}")
+            logger.error("Error cancelling order: %s", e)
             return None
     
     def create_market_order(self, symbol: str, side: str, amount: float) -> Optional[Dict]:
@@ -610,7 +631,7 @@ class BybitClient(BaseExchangeClient):
             response = self._post_private("/v5/order/create", data)
             
             if response and "result" in response and "orderId" in response["result"]:
-                logger.info(f"Market order placed: {response['result']['orderId']}")
+                logger.info("Market order placed: %s", response['result']['orderId'])
                 return {
                     "id": response["result"]["orderId"],
                     "symbol": symbol,
@@ -621,12 +642,69 @@ class BybitClient(BaseExchangeClient):
                 }
             else:
                 error_msg = response.get("retMsg", "Unknown error") if response else "No response"
-                logger.error(f"Failed to create market order: {error_msg}")
+                logger.error("Failed to create market order: %s", error_msg)
                 return None
         except Exception as e:
-            logger.error(f"Failed to create market order: {str(e)}")
+            logger.error("Failed to create market order: %s", e)
             return None
     
+    def create_batch_market_orders(self, orders: List[Dict[str, Any]], reduce_only: bool = True) -> List[Optional[Dict]]:
+        """Place several market orders with the batch endpoint.
+        
+        Args:
+            orders: Dicts with symbol, side ('buy'/'sell') and amount
+            reduce_only: Only reduce existing positions (for closing)
+        
+        Returns:
+            Results in the same order as the input; None for orders that were rejected
+        """
+        results: List[Optional[Dict]] = [None] * len(orders)
+        
+        # The batch endpoint takes one category per request
+        by_category: Dict[str, List[int]] = {}
+        for i, order in enumerate(orders):
+            by_category.setdefault(self._detect_symbol_category(order["symbol"]), []).append(i)
+        
+        for category, indices in by_category.items():
+            for start in range(0, len(indices), self.MAX_BATCH_ORDERS):
+                chunk = indices[start:start + self.MAX_BATCH_ORDERS]
+                data = {
+                    "category": category,
+                    "request": [{
+                        "symbol": self._normalize_symbol(orders[i]["symbol"]),
+                        "side": orders[i]["side"].capitalize(),
+                        "orderType": "Market",
+                        "qty": str(orders[i]["amount"]),
+                        "reduceOnly": reduce_only
+                    } for i in chunk]
+                }
+                
+                response = self._post_private("/v5/order/create-batch", data)
+                if not response or response.get("retCode") != 0:
+                    error_msg = response.get("retMsg", "Unknown error") if response else "No response"
+                    logger.error("Failed to create batch market orders: %s", error_msg)
+                    continue
+                
+                placed = response.get("result", {}).get("list", [])
+                statuses = response.get("retExtInfo", {}).get("list", [])
+                for pos, i in enumerate(chunk):
+                    status = statuses[pos] if pos < len(statuses) else {}
+                    item = placed[pos] if pos < len(placed) else {}
+                    if status.get("code", 0) != 0 or not item.get("orderId"):
+                        logger.error("Batch market order for %s rejected: %s",
+                                     orders[i]["symbol"], status.get("msg", "Unknown error"))
+                        continue
+                    results[i] = {
+                        "id": item["orderId"],
+                        "symbol": orders[i]["symbol"],
+                        "side": orders[i]["side"].lower(),
+                        "amount": orders[i]["amount"],
+                        "status": "filled",  # Market orders are usually filled immediately
+                        "info": item
+                    }
+        
+        return results
+    
     def set_position_mode(self, mode, symbol=None):
         """Set position mode for the account or specific symbol.
         
@@ -669,7 +747,7 @@ class BybitClient(BaseExchangeClient):
     def create_limit_order(self, symbol, side, amount, price, params=None):
         """Create a limit order (simplified wrapper)."""
         try:
-            logger.info(f"Creating limit order: {symbol} {side} {amount} @ {price}")
+            logger.info("Creating limit order: %s %s %s @ %s", symbol, side, amount, price)
             return self._create_order(
                 symbol=symbol,
                 side=side,
@@ -679,13 +757,13 @@ class BybitClient(BaseExchangeClient):
                 time_in_force="GTC"
             )
         except Exception as e:
-            logger.error(f"Error in create_limit_order: {str(e)}")
+            logger.error("Error in create_limit_order: %s", e)
             return None
     
     def _create_order(self, symbol, side, order_type, qty, price=None, time_in_force="GTC"):
         """Create a new order with simplified interface."""
         try:
-            logger.info(f"Creating order: {symbol} {side} {order_type} {qty} @ {price}")
+            logger.info("Creating order: %s %s %s %s @ %s", symbol, side, order_type, qty, price)
             
             # Validate inputs
             if not symbol or not side or not order_type or not qty:
@@ -706,7 +784,7 @@ class BybitClient(BaseExchangeClient):
             else:
                 category = 'spot'
             
-            logger.info(f"Order category: {category}")
+            logger.info("Order category: %s", category)
             
             # Create order data
             data = {
@@ -727,15 +805,15 @@ class BybitClient(BaseExchangeClient):
             data["timeInForce"] = "GTC"
             
             # Make the API request
-            logger.info(f"Sending order request to Bybit: {data}")
+            logger.info("Sending order request to Bybit: %s", data)
             response = self._post_private("/v5/order/create", data)
             
             if response:
-                logger.info(f"Full API response: {response}")
+                logger.info("Full API response: %s", response)
                 
             if response and "result" in response and "orderId" in response["result"]:
                 order_id = response["result"]["orderId"]
-                logger.info(f"Order created successfully: {order_id}")
+                logger.info("Order created successfully: %s", order_id)
                 return order_id
             else:
                 error_msg = "Unknown error"
@@ -745,11 +823,11 @@ class BybitClient(BaseExchangeClient):
                     elif "ret_msg" in response:
                         error_msg = response["ret_msg"]
                 
-                logger.error(f"Failed to create order: {error_msg}")
+                logger.error("Failed to create order: %s", error_msg)
                 return None
             
         except Exception as e:
-            logger.error(f"Error in _create_order: {str(e)}")
+            logger.error("Error in _create_order: %s", e)
             logger.exception("Full traceback:")
             return None
     
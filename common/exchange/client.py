@@ -7,6 +7,7 @@ import requests
 import urllib.parse
 from urllib.parse import urlencode
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 logger = setup_logger(__name__)
 
@@ -18,6 +19,8 @@ except ImportError:
     CCXT_AVAILABLE = False
 
 class ExchangeClient:
+    MAX_CANCEL_WORKERS = 8  # Concurrent cancel requests when bulk cancel is unavailable
+    
     def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
         """Initialize exchange client.
         
@@ -109,13 +112,24 @@ class ExchangeClient:
     def cancel_all_orders(self, symbol: str) -> bool:
         """Cancel all open orders for a symbol."""
         try:
+            # Prefer the exchange's bulk cancel endpoint (one request for all orders)
+            if self.exchange.has.get('cancelAllOrders'):
+                self.exchange.cancel_all_orders(symbol)
+                logger.info(f"Cancelled all orders for {symbol}")
+                return True
+            
             # First get open orders
             open_orders = self.get_open_orders(symbol)
             
-            # Cancel each order
-            for order in open_orders:
-                self.exchange.cancel_order(id=order['id'], symbol=symbol)
-                logger.info(f"Cancelled order {order['id']} for {symbol}")
+            # Cancel each order, overlapping the requests instead of waiting on each in turn
+            if open_orders:
+                def cancel(order):
+                    self.exchange.cancel_order(id=order['id'], symbol=symbol)
+                    logger.info(f"Cancelled order {order['id']} for {symbol}")
+                
+                with ThreadPoolExecutor(max_workers=min(len(open_orders), self.MAX_CANCEL_WORKERS)) as executor:
+                    # Consume the results so the first failure propagates
+                    list(executor.map(cancel, open_orders))
             
             logger.info(f"Cancelled {len(open_orders)} orders for {symbol}")
             return True
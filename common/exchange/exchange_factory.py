@@ -4,6 +4,22 @@ from common.exchange.binance_client import BinanceClient
 from common.exchange.hyperliquid_client import HyperliquidClient
 from common.exchange.bybit_client import BybitClient
 
+# Lowercased exchange name -> client class
+_EXCHANGES = {
+    'binance': BinanceClient,
+    'hyperliquid': HyperliquidClient,
+    'bybit': BybitClient,
+}
+
+def register_exchange(name: str, client_class: type) -> None:
+    """Register an exchange client class under the given name.
+    
+    Args:
+        name: Name of the exchange (case-insensitive)
+        client_class: Client class taking (api_key, api_secret, testnet)
+    """
+    _EXCHANGES[name.lower()] = client_class
+
 def create_exchange(exchange_name: str, api_key: str, api_secret: str, testnet: bool = False) -> BaseExchangeClient:
     """Create an exchange client based on the exchange name.
     
@@ -16,11 +32,7 @@ def create_exchange(exchange_name: str, api_key: str, api_secret: str, testnet:
     Returns:
         An exchange client
     """
-    if exchange_name.lower() == 'binance':
-        return BinanceClient(api_key, api_secret, testnet)
-    elif exchange_name.lower() == 'hyperliquid':
-        return HyperliquidClient(api_key, api_secret, testnet)
-    elif exchange_name.lower() == 'bybit':
-        return BybitClient(api_key, api_secret, testnet)
-    else:
-        raise ValueError(f"Unsupported exchange: {exchange_name}") 
\ No newline at end of file
+    client_class = _EXCHANGES.get(exchange_name.lower())
+    if client_class is None:
+        raise ValueError(f"Unsupported exchange: {exchange_name}")
+    return client_class(api_key, api_secret, testnet)
\ No newline at end of file
@@ -1,7 +1,6 @@
 from typing import Optional
 from common.exchange.base_client import BaseExchangeClient
-from common.exchange.binance_client import BinanceClient
-from common.exchange.hyperliquid_client import HyperliquidClient
+from common.exchange.exchange_factory import create_exchange
 
 class ExchangeFactory:
     """Factory for creating exchange clients."""
@@ -14,11 +13,4 @@ class ExchangeFactory:
         testnet: bool = True
     ) -> Optional[BaseExchangeClient]:
         """Create an exchange client instance."""
-        exchange_name = exchange_name.lower()
-        
-        if exchange_name == "binance":
-            return BinanceClient(api_key, api_secret, testnet)
-        elif exchange_name == "hyperliquid":
-            return HyperliquidClient(api_key, api_secret, testnet)
-        else:
-            raise ValueError(f"Unsupported exchange: {exchange_name}") 
\ No newline at end of file
+        return create_exchange(exchange_name, api_key, api_secret, testnet)
\ No newline at end of file
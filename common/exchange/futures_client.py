@@ -4,28 +4,79 @@ import time
 import hmac
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import random
+import threading
+from operator import itemgetter
+from urllib.parse import urlencode
 
 logger = setup_logger(__name__)
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Fields read from each open order in one C-level lookup
+_ORDER_FIELDS = itemgetter('orderId', 'symbol', 'side', 'origQty', 'price', 'status')
+
 class FuturesExchangeClient:
     """Client for Binance Futures API."""
     
+    # Seconds between re-measuring the local/server clock offset
+    TIME_SYNC_INTERVAL = 300
+    
+    # Client order IDs look like grid-<unix seconds>-<random suffix>
+    ORDER_ID_PREFIX = "grid-"
+    
+    # Open-order responses at least this large are parsed incrementally (needs ijson)
+    STREAM_PARSE_MIN_BYTES = 1024 * 1024
+    
+    # Orders accepted per /fapi/v1/batchOrders request
+    MAX_BATCH_ORDERS = 5
+    
+    # Signed POST/DELETE parameters travel in the request body
+    FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+    
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
         """Initialize Binance Futures client."""
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
         
+        # Keyed HMAC prototype; copying it skips re-deriving the key pads per request
+        self._hmac_template = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        
         # Debug log - Show partial API key for debugging
         logger.info(f"Using API key: {api_key[:5]}...{api_key[-5:] if len(api_key) > 10 else ''}")
         
         # Base URLs
         if testnet:
             self.base_url = "https://testnet.binancefuture.com"
+            self.stream_url = "wss://stream.binancefuture.com"
         else:
             self.base_url = "https://fapi.binance.com"
+            self.stream_url = "wss://fstream.binance.com"
+        
+        # Persistent session so calls reuse pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        self._session.headers.update({'X-MBX-APIKEY': api_key})
+        
+        # Offset between server and local clocks, refreshed periodically
+        self._time_offset_ms = 0
+        self._offset_refreshed_at = None
+        self._time_sync_lock = threading.Lock()
+        
+        # BTC/USDT <-> BTCUSDT conversions, computed once per symbol
+        self._exchange_symbols: Dict[str, str] = {}
+        self._display_symbols: Dict[str, str] = {}
             
         # Test connection
         try:
@@ -35,45 +86,81 @@ class FuturesExchangeClient:
             logger.error(f"Failed to connect to Binance Futures: {str(e)}")
             raise
     
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def _format_symbol(self, symbol: str) -> str:
+        """Convert symbol format from BTC/USDT to BTCUSDT."""
+        formatted = self._exchange_symbols.get(symbol)
+        if formatted is None:
+            formatted = self._exchange_symbols[symbol] = symbol.replace('/', '')
+        return formatted
+    
+    def _display_symbol(self, exchange_symbol: str) -> str:
+        """Convert symbol format from BTCUSDT back to BTC/USDT."""
+        symbol = self._display_symbols.get(exchange_symbol)
+        if symbol is None:
+            symbol = self._display_symbols[exchange_symbol] = f"{exchange_symbol[:-4]}/{exchange_symbol[-4:]}"
+        return symbol
+    
+    def _sync_time(self):
+        """Measure the offset between server time and local time.
+        
+        On failure the previous offset is kept and left stale, so the next
+        signed call retries the sync; until then timestamps fall back to
+        local time plus the last known offset.
+        """
+        url = f"{self.base_url}/fapi/v1/time"
+        try:
+            response = self._session.get(url)
+            if response.status_code != 200:
+                logger.warning(f"Failed to sync server time: {response.text}")
+                return
+            self._time_offset_ms = json_loads(response.content)['serverTime'] - int(time.time() * 1000)
+            self._offset_refreshed_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Error syncing server time: {str(e)}")
+    
+    def _offset_is_stale(self) -> bool:
+        return (self._offset_refreshed_at is None or
+                time.monotonic() - self._offset_refreshed_at > self.TIME_SYNC_INTERVAL)
+    
     def _get_timestamp(self) -> int:
         """Get server timestamp to avoid time sync issues."""
-        url = f"{self.base_url}/fapi/v1/time"
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()['serverTime']
-        return int(time.time() * 1000)
+        if self._offset_is_stale():
+            # Only one caller re-measures; concurrent callers wait and reuse its result
+            with self._time_sync_lock:
+                if self._offset_is_stale():
+                    self._sync_time()
+        return int(time.time() * 1000) + self._time_offset_ms
     
     def _sign_request(self, params: Dict) -> tuple:
         """Sign request with API secret."""
-        # Convert all values to strings
-        params = {k: str(v) for k, v in params.items()}
-        
-        # Create query string
-        query_string = '&'.join([f"{key}={params[key]}" for key in params])
+        # Create query string (urlencode stringifies and escapes values)
+        query_string = urlencode(params)
         
         # Create signature
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(query_string.encode('utf-8'))
+        signature = mac.hexdigest()
         
         return query_string, signature
     
     def get_ticker(self, symbol: str) -> Optional[float]:
         """Get current price for symbol."""
         # Convert symbol format from BTC/USDT to BTCUSDT
-        formatted_symbol = symbol.replace('/', '')
+        formatted_symbol = self._format_symbol(symbol)
         
         url = f"{self.base_url}/fapi/v1/ticker/price"
         params = {'symbol': formatted_symbol}
         
         try:
-            response = requests.get(url, params=params)
+            response = self._session.get(url, params=params)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 price = float(data['price'])
-                logger.info(f"Current price for {symbol}: {price}")
+                logger.info("Current price for %s: %s", symbol, price)
                 return price
             else:
                 logger.error(f"Failed to get ticker: {response.text}")
@@ -85,13 +172,13 @@ class FuturesExchangeClient:
     def create_order(self, symbol: str, side: str, amount: float, price: float) -> Optional[Dict[str, Any]]:
         """Create limit order."""
         # Convert symbol format
-        formatted_symbol = symbol.replace('/', '')
+        formatted_symbol = self._format_symbol(symbol)
         
         # Get server time for timestamp
         timestamp = self._get_timestamp()
         
         # Add client order ID to help track orders
-        order_id = f"grid-{int(time.time())}-{random.randint(1000, 9999)}"
+        order_id = self.ORDER_ID_PREFIX + str(int(time.time())) + '-' + str(random.getrandbits(14))
         
         # Prepare parameters
         params = {
@@ -99,30 +186,29 @@ class FuturesExchangeClient:
             'side': side.upper(),
             'type': 'LIMIT',
             'timeInForce': 'GTC',
-            'quantity': str(amount),  # Convert to string
-            'price': str(price),      # Convert to string
-            'timestamp': str(timestamp),
-            'recvWindow': '5000',
+            'quantity': amount,
+            'price': price,
+            'timestamp': timestamp,
+            'recvWindow': 5000,
             'newClientOrderId': order_id
         }
         
         # Sign request
         query_string, signature = self._sign_request(params)
-        url = f"{self.base_url}/fapi/v1/order?{query_string}&signature={signature}"
-        
-        # Prepare headers
-        headers = {
-            'X-MBX-APIKEY': self.api_key
-        }
+        return self._post_order(symbol, side, f"{query_string}&signature={signature}")
+
+    def _post_order(self, symbol: str, side: str, body: str) -> Optional[Dict[str, Any]]:
+        """Submit a signed order body and shape the response."""
+        url = f"{self.base_url}/fapi/v1/order"
         
         # Debug output
-        logger.debug(f"Placing order: URL={url}, Headers={headers}")
+        logger.debug("Placing order: URL=%s, body=%s", url, body)
         
         try:
-            response = requests.post(url, headers=headers)
+            response = self._session.post(url, data=body, headers=self.FORM_HEADERS)
             if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Created {side} order: {data['orderId']}")
+                data = json_loads(response.content)
+                logger.info("Created %s order: %s", side, data['orderId'])
                 return {
                     'id': str(data['orderId']),
                     'symbol': symbol,
@@ -138,6 +224,69 @@ class FuturesExchangeClient:
             logger.error(f"Error creating order: {str(e)}")
             return None
 
+    def create_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Create several limit orders using the batch endpoint.
+        
+        Args:
+            orders: List of create_order keyword arguments (symbol, side, amount, price)
+        
+        Returns:
+            Results in the same order as the input; None for orders that were rejected
+        """
+        if len(orders) == 1:
+            return [self.create_order(**orders[0])]
+        
+        results = []
+        for start in range(0, len(orders), self.MAX_BATCH_ORDERS):
+            chunk = orders[start:start + self.MAX_BATCH_ORDERS]
+            
+            # The batch endpoint expects string values inside the JSON list
+            batch = [{
+                'symbol': self._format_symbol(order['symbol']),
+                'side': order['side'].upper(),
+                'type': 'LIMIT',
+                'timeInForce': 'GTC',
+                'quantity': str(order['amount']),
+                'price': str(order['price']),
+                'newClientOrderId': self.ORDER_ID_PREFIX + str(int(time.time())) + '-' + str(random.getrandbits(14))
+            } for order in chunk]
+            
+            params = {
+                'batchOrders': json.dumps(batch, separators=(',', ':')),
+                'timestamp': self._get_timestamp(),
+                'recvWindow': 5000
+            }
+            
+            # Sign request
+            query_string, signature = self._sign_request(params)
+            url = f"{self.base_url}/fapi/v1/batchOrders"
+            
+            try:
+                response = self._session.post(url, data=f"{query_string}&signature={signature}", headers=self.FORM_HEADERS)
+                if response.status_code == 200:
+                    for order, data in zip(chunk, json_loads(response.content)):
+                        if 'orderId' not in data:
+                            logger.error(f"Failed to create order: {data.get('msg', data)}")
+                            results.append(None)
+                            continue
+                        logger.info("Created %s order: %s", order['side'], data['orderId'])
+                        results.append({
+                            'id': str(data['orderId']),
+                            'symbol': order['symbol'],
+                            'side': order['side'].lower(),
+                            'amount': float(data['origQty']),
+                            'price': float(data['price']),
+                            'status': data['status'].lower()
+                        })
+                else:
+                    logger.error(f"Failed to create orders: {response.text}")
+                    results.extend([None] * len(chunk))
+            except Exception as e:
+                logger.error(f"Error creating orders: {str(e)}")
+                results.extend([None] * len(chunk))
+        
+        return results
+
     def get_open_orders(self, symbol: str = None) -> List[Dict[str, Any]]:
         """Get all open orders for a symbol."""
         # Get server time for timestamp
@@ -151,39 +300,38 @@ class FuturesExchangeClient:
         
         if symbol:
             # Convert symbol format
-            formatted_symbol = symbol.replace('/', '')
+            formatted_symbol = self._format_symbol(symbol)
             params['symbol'] = formatted_symbol
         
         # Sign request
         query_string, signature = self._sign_request(params)
         url = f"{self.base_url}/fapi/v1/openOrders?{query_string}&signature={signature}"
         
-        # Prepare headers
-        headers = {
-            'X-MBX-APIKEY': self.api_key
-        }
-        
         try:
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                orders = []
-                for order in data:
-                    # Convert BTCUSDT back to BTC/USDT format
-                    symbol_with_slash = f"{order['symbol'][:-4]}/{order['symbol'][-4:]}"
-                    orders.append({
-                        'id': str(order['orderId']),
-                        'symbol': symbol_with_slash,
-                        'side': order['side'].lower(),
-                        'amount': float(order['origQty']),
-                        'price': float(order['price']),
-                        'status': order['status'].lower()
-                    })
-                logger.info(f"Found {len(orders)} open orders")
-                return orders
-            else:
-                logger.error(f"Failed to get open orders: {response.text}")
-                return []
+            with self._session.get(url, stream=True) as response:
+                if response.status_code == 200:
+                    content_length = int(response.headers.get('Content-Length', 0))
+                    if ijson is not None and (content_length == 0 or content_length >= self.STREAM_PARSE_MIN_BYTES):
+                        # Yield orders one at a time instead of materializing the whole array first
+                        response.raw.decode_content = True
+                        data = ijson.items(response.raw, 'item')
+                    else:
+                        data = json_loads(response.content)
+                    
+                    display_symbol = self._display_symbol
+                    orders = [{
+                        'id': str(order_id),
+                        'symbol': display_symbol(exchange_symbol),
+                        'side': side.lower(),
+                        'amount': float(quantity),
+                        'price': float(price),
+                        'status': status.lower()
+                    } for order_id, exchange_symbol, side, quantity, price, status in map(_ORDER_FIELDS, data)]
+                    logger.info("Found %d open orders", len(orders))
+                    return orders
+                else:
+                    logger.error(f"Failed to get open orders: {response.text}")
+                    return []
         except Exception as e:
             logger.error(f"Error getting open orders: {str(e)}")
             return []
@@ -191,7 +339,7 @@ class FuturesExchangeClient:
     def cancel_all_orders(self, symbol: str) -> bool:
         """Cancel all open orders for a symbol."""
         # Convert symbol format
-        formatted_symbol = symbol.replace('/', '')
+        formatted_symbol = self._format_symbol(symbol)
         
         # Get server time for timestamp
         timestamp = self._get_timestamp()
@@ -205,18 +353,13 @@ class FuturesExchangeClient:
         
         # Sign request
         query_string, signature = self._sign_request(params)
-        url = f"{self.base_url}/fapi/v1/allOpenOrders?{query_string}&signature={signature}"
-        
-        # Prepare headers
-        headers = {
-            'X-MBX-APIKEY': self.api_key
-        }
+        url = f"{self.base_url}/fapi/v1/allOpenOrders"
         
         try:
-            response = requests.delete(url, headers=headers)
+            response = self._session.delete(url, data=f"{query_string}&signature={signature}", headers=self.FORM_HEADERS)
             if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Cancelled all orders for {symbol}")
+                data = json_loads(response.content)
+                logger.info("Cancelled all orders for %s", symbol)
                 return True
             else:
                 logger.error(f"Failed to cancel orders: {response.text}")
@@ -225,6 +368,36 @@ class FuturesExchangeClient:
             logger.error(f"Error cancelling orders: {str(e)}")
             return False
     
+    def create_listen_key(self) -> Optional[str]:
+        """Open a user data stream and return its listen key."""
+        url = f"{self.base_url}/fapi/v1/listenKey"
+        
+        try:
+            response = self._session.post(url)
+            if response.status_code == 200:
+                return json_loads(response.content)['listenKey']
+            else:
+                logger.error(f"Failed to create listen key: {response.text}")
+                return None
+        except Exception as e:
+            logger.error(f"Error creating listen key: {str(e)}")
+            return None
+    
+    def keepalive_listen_key(self) -> bool:
+        """Extend the user data stream's validity by another 60 minutes."""
+        url = f"{self.base_url}/fapi/v1/listenKey"
+        
+        try:
+            response = self._session.put(url)
+            if response.status_code == 200:
+                return True
+            else:
+                logger.error(f"Failed to keep listen key alive: {response.text}")
+                return False
+        except Exception as e:
+            logger.error(f"Error keeping listen key alive: {str(e)}")
+            return False
+    
     def get_account_balance(self, currency: str = None) -> Dict[str, Any]:
         """Get account balance."""
         # Get server time for timestamp
@@ -240,15 +413,10 @@ class FuturesExchangeClient:
         query_string, signature = self._sign_request(params)
         url = f"{self.base_url}/fapi/v2/balance?{query_string}&signature={signature}"
         
-        # Prepare headers
-        headers = {
-            'X-MBX-APIKEY': self.api_key
-        }
-        
         try:
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 result = {}
                 
                 for asset in data:
@@ -262,13 +430,13 @@ class FuturesExchangeClient:
                 
                 if currency:
                     if currency in result:
-                        logger.info(f"{currency} balance: {result[currency]['free']}")
+                        logger.info("%s balance: %s", currency, result[currency]['free'])
                         return result[currency]
                     else:
                         logger.warning(f"Currency {currency} not found in balance")
                         return {'free': 0.0, 'used': 0.0, 'total': 0.0}
                 else:
-                    logger.info(f"Account has {len(result)} currencies with non-zero balance")
+                    logger.info("Account has %d currencies with non-zero balance", len(result))
                     return result
             else:
                 logger.error(f"Failed to get account balance: {response.text}")
@@ -294,20 +462,15 @@ class FuturesExchangeClient:
         
         # Sign request
         query_string, signature = self._sign_request(params)
-        url = f"{self.base_url}/fapi/v1/leverage?{query_string}&signature={signature}"
+        url = f"{self.base_url}/fapi/v1/leverage"
         
         # Log the URL being sent
-        logger.info(f"Setting leverage with URL: {self.base_url}/fapi/v1/leverage")
-        
-        # Prepare headers
-        headers = {
-            'X-MBX-APIKEY': self.api_key
-        }
+        logger.info(f"Setting leverage with URL: {url}")
         
         try:
-            response = requests.post(url, headers=headers)
+            response = self._session.post(url, data=f"{query_string}&signature={signature}", headers=self.FORM_HEADERS)
             if response.status_code == 200:
-                logger.info(f"Set leverage for {symbol} to {leverage}x")
+                logger.info("Set leverage for %s to %sx", symbol, leverage)
                 return True
             else:
                 logger.error(f"Failed to set leverage: {response.text}")
@@ -0,0 +1,271 @@
+from typing import Optional, Dict, Any, List
+from common.utils.logger import setup_logger
+import asyncio
+import time
+import hmac
+import hashlib
+import json
+import random
+from operator import itemgetter
+from urllib.parse import urlencode
+
+import aiohttp
+
+logger = setup_logger(__name__)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Fields read from each open order in one C-level lookup
+_ORDER_FIELDS = itemgetter('orderId', 'symbol', 'side', 'origQty', 'price', 'status')
+
+class AsyncFuturesExchangeClient:
+    """Asyncio client for Binance Futures API.
+    
+    Mirrors FuturesExchangeClient but lets independent requests (e.g. a batch of
+    grid orders or tickers for several symbols) be in flight at the same time.
+    """
+    
+    # Seconds between re-measuring the local/server clock offset
+    TIME_SYNC_INTERVAL = 300
+    
+    # Client order IDs look like grid-<unix seconds>-<random suffix>
+    ORDER_ID_PREFIX = "grid-"
+    
+    # Signed POST/DELETE parameters travel in the request body
+    FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+    
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+        """Initialize Binance Futures client.
+        
+        The HTTP session is opened lazily on first use so the client can be
+        constructed outside a running event loop.
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.testnet = testnet
+        
+        # Keyed HMAC prototype; copying it skips re-deriving the key pads per request
+        self._hmac_template = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        
+        # Base URLs
+        if testnet:
+            self.base_url = "https://testnet.binancefuture.com"
+        else:
+            self.base_url = "https://fapi.binance.com"
+        
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Offset between server and local clocks, refreshed periodically
+        self._time_offset_ms = 0
+        self._offset_refreshed_at = None
+        self._time_sync_lock = asyncio.Lock()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self.base_url,
+                headers={'X-MBX-APIKEY': self.api_key},
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    @staticmethod
+    def _format_symbol(symbol: str) -> str:
+        """Convert symbol format from BTC/USDT to BTCUSDT."""
+        return symbol.replace('/', '')
+    
+    @staticmethod
+    def _display_symbol(exchange_symbol: str) -> str:
+        """Convert symbol format from BTCUSDT back to BTC/USDT."""
+        return f"{exchange_symbol[:-4]}/{exchange_symbol[-4:]}"
+    
+    async def _sync_time(self):
+        """Measure the offset between server time and local time.
+        
+        On failure the previous offset is kept and left stale, so the next
+        signed call retries the sync; until then timestamps fall back to
+        local time plus the last known offset.
+        """
+        try:
+            async with self._get_session().get("/fapi/v1/time") as response:
+                if response.status != 200:
+                    logger.warning(f"Failed to sync server time: {await response.text()}")
+                    return
+                data = json_loads(await response.read())
+                self._time_offset_ms = data['serverTime'] - int(time.time() * 1000)
+                self._offset_refreshed_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Error syncing server time: {str(e)}")
+    
+    def _offset_is_stale(self) -> bool:
+        return (self._offset_refreshed_at is None or
+                time.monotonic() - self._offset_refreshed_at > self.TIME_SYNC_INTERVAL)
+    
+    async def _get_timestamp(self) -> int:
+        """Get server timestamp to avoid time sync issues."""
+        if self._offset_is_stale():
+            # Only one task re-measures; concurrent tasks wait and reuse its result
+            async with self._time_sync_lock:
+                if self._offset_is_stale():
+                    await self._sync_time()
+        return int(time.time() * 1000) + self._time_offset_ms
+    
+    def _sign_request(self, params: Dict) -> tuple:
+        """Sign request with API secret."""
+        # Create query string (urlencode stringifies and escapes values)
+        query_string = urlencode(params)
+        
+        # Create signature
+        mac = self._hmac_template.copy()
+        mac.update(query_string.encode('utf-8'))
+        signature = mac.hexdigest()
+        
+        return query_string, signature
+    
+    async def get_ticker(self, symbol: str) -> Optional[float]:
+        """Get current price for symbol."""
+        params = {'symbol': self._format_symbol(symbol)}
+        
+        try:
+            async with self._get_session().get("/fapi/v1/ticker/price", params=params) as response:
+                if response.status == 200:
+                    data = json_loads(await response.read())
+                    price = float(data['price'])
+                    logger.info("Current price for %s: %s", symbol, price)
+                    return price
+                else:
+                    logger.error(f"Failed to get ticker: {await response.text()}")
+                    return None
+        except Exception as e:
+            logger.error(f"Error getting ticker: {str(e)}")
+            return None
+    
+    async def get_tickers(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """Get current prices for several symbols concurrently."""
+        prices = await asyncio.gather(*(self.get_ticker(symbol) for symbol in symbols))
+        return dict(zip(symbols, prices))
+    
+    async def create_order(self, symbol: str, side: str, amount: float, price: float) -> Optional[Dict[str, Any]]:
+        """Create limit order."""
+        timestamp = await self._get_timestamp()
+        
+        # Add client order ID to help track orders
+        order_id = self.ORDER_ID_PREFIX + str(int(time.time())) + '-' + str(random.getrandbits(14))
+        
+        params = {
+            'symbol': self._format_symbol(symbol),
+            'side': side.upper(),
+            'type': 'LIMIT',
+            'timeInForce': 'GTC',
+            'quantity': amount,
+            'price': price,
+            'timestamp': timestamp,
+            'recvWindow': 5000,
+            'newClientOrderId': order_id
+        }
+        
+        query_string, signature = self._sign_request(params)
+        
+        try:
+            async with self._get_session().post("/fapi/v1/order", data=f"{query_string}&signature={signature}",
+                                                headers=self.FORM_HEADERS) as response:
+                if response.status == 200:
+                    data = json_loads(await response.read())
+                    logger.info("Created %s order: %s", side, data['orderId'])
+                    return {
+                        'id': str(data['orderId']),
+                        'symbol': symbol,
+                        'side': side.lower(),
+                        'amount': float(data['origQty']),
+                        'price': float(data['price']),
+                        'status': data['status'].lower()
+                    }
+                else:
+                    logger.error(f"Failed to create order: {await response.text()}")
+                    return None
+        except Exception as e:
+            logger.error(f"Error creating order: {str(e)}")
+            return None
+    
+    async def create_orders_bulk(self, orders: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Place several orders concurrently.
+        
+        Args:
+            orders: List of create_order keyword arguments
+        
+        Returns:
+            Results in the same order as the input; None for orders that failed
+        """
+        return await asyncio.gather(*(self.create_order(**order) for order in orders))
+    
+    async def get_open_orders(self, symbol: str = None) -> List[Dict[str, Any]]:
+        """Get all open orders for a symbol."""
+        params = {
+            'timestamp': await self._get_timestamp(),
+            'recvWindow': 5000
+        }
+        
+        if symbol:
+            params['symbol'] = self._format_symbol(symbol)
+        
+        query_string, signature = self._sign_request(params)
+        
+        try:
+            async with self._get_session().get(f"/fapi/v1/openOrders?{query_string}&signature={signature}") as response:
+                if response.status == 200:
+                    data = json_loads(await response.read())
+                    orders = [{
+                        'id': str(order_id),
+                        'symbol': self._display_symbol(exchange_symbol),
+                        'side': side.lower(),
+                        'amount': float(quantity),
+                        'price': float(price),
+                        'status': status.lower()
+                    } for order_id, exchange_symbol, side, quantity, price, status in map(_ORDER_FIELDS, data)]
+                    logger.info("Found %d open orders", len(orders))
+                    return orders
+                else:
+                    logger.error(f"Failed to get open orders: {await response.text()}")
+                    return []
+        except Exception as e:
+            logger.error(f"Error getting open orders: {str(e)}")
+            return []
+    
+    async def cancel_all_orders(self, symbol: str) -> bool:
+        """Cancel all open orders for a symbol."""
+        params = {
+            'symbol': self._format_symbol(symbol),
+            'timestamp': await self._get_timestamp(),
+            'recvWindow': 5000
+        }
+        
+        query_string, signature = self._sign_request(params)
+        
+        try:
+            async with self._get_session().delete("/fapi/v1/allOpenOrders", data=f"{query_string}&signature={signature}",
+                                                  headers=self.FORM_HEADERS) as response:
+                if response.status == 200:
+                    logger.info("Cancelled all orders for %s", symbol)
+                    return True
+                else:
+                    logger.error(f"Failed to cancel orders: {await response.text()}")
+                    return False
+        except Exception as e:
+            logger.error(f"Error cancelling orders: {str(e)}")
+            return False
@@ -2,13 +2,19 @@ from typing import Dict, Any, Optional, List
 from common.exchange.base_client import BaseExchangeClient
 from common.utils.logger import setup_logger
 from hyperliquid.info import Info
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import time
 
 logger = setup_logger(__name__)
 
 class HyperliquidClient(BaseExchangeClient):
     """Hyperliquid exchange client implementation."""
     
+    # Seconds a pushed mid/orderbook stays usable before falling back to REST
+    MARKET_DATA_MAX_AGE = 2.0
+    
     def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
         """Initialize the Hyperliquid client.
         
@@ -26,11 +32,34 @@ class HyperliquidClient(BaseExchangeClient):
         self.base_url = "https://dev.hyperliquid.xyz" if testnet else "https://api.hyperliquid.xyz"
         self.info = Info(self.base_url)
         
+        # The SDK keeps one requests.Session; widen its keep-alive pool and retry dropped connections
+        self.info.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        ))
+        
+        # BTC/USDT -> BTC conversions, computed once per symbol
+        self._coins: Dict[str, str] = {}
+        
+        # Market data pushed over the SDK's websocket. _mids is the latest
+        # allMids snapshot (coin -> mid price string, as all_mids() returns),
+        # stamped once in _mids_updated_at; _books maps coin -> (received_at, l2Book)
+        self._mids: Dict[str, str] = {}
+        self._mids_updated_at: Optional[float] = None
+        self._books: Dict[str, tuple] = {}
+        
         # Initialize connection
         try:
             # Test connection
             meta = self.info.meta()
-            self.available_pairs = [asset['name'] for asset in meta['universe']]
+            self.available_pairs = {asset['name'] for asset in meta['universe']}
+            
+            # Stream mids instead of polling all_mids() on every ticker call
+            try:
+                self.info.subscribe({"type": "allMids"}, self._on_all_mids)
+            except Exception as e:
+                logger.warning(f"Mid price stream unavailable, using REST: {str(e)}")
             
             # Get proper API name
             environment = "testnet" if testnet else "mainnet"
@@ -39,19 +68,39 @@ class HyperliquidClient(BaseExchangeClient):
             logger.error(f"Failed to connect to Hyperliquid: {str(e)}")
             raise
     
+    def _coin(self, symbol: str) -> str:
+        """Normalize symbol format (strip /USD or /USDT if present)."""
+        coin = self._coins.get(symbol)
+        if coin is None:
+            coin = self._coins[symbol] = symbol.split('/')[0].upper().strip()
+        return coin
+    
+    def _on_all_mids(self, message: Dict[str, Any]):
+        """Websocket callback for allMids updates."""
+        self._mids = message["data"]["mids"]
+        self._mids_updated_at = time.monotonic()
+    
+    def _on_l2_book(self, message: Dict[str, Any]):
+        """Websocket callback for l2Book updates."""
+        book = message["data"]
+        self._books[book["coin"]] = (time.monotonic(), book)
+    
+    def _is_fresh(self, received_at: Optional[float]) -> bool:
+        """Check whether pushed market data is recent enough to use."""
+        return received_at is not None and time.monotonic() - received_at <= self.MARKET_DATA_MAX_AGE
+    
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """Get current ticker for a symbol."""
         try:
-            # Normalize symbol format (strip /USD or /USDT if present)
-            coin = symbol.split('/')[0].upper().strip()
+            coin = self._coin(symbol)
             
             # Verify coin exists
             if coin not in self.available_pairs:
                 logger.warning(f"Symbol {coin} not found in available pairs")
                 return {}
             
-            # Get current price
-            prices = self.info.all_mids()
+            # Get current price, from the stream when it is fresh
+            prices = self._mids if self._is_fresh(self._mids_updated_at) else self.info.all_mids()
             if coin in prices:
                 price = float(prices[coin])
                 
@@ -72,22 +121,31 @@ class HyperliquidClient(BaseExchangeClient):
     def get_orderbook(self, symbol: str) -> Dict[str, Any]:
         """Get orderbook for a symbol."""
         try:
-            # Normalize symbol format
-            coin = symbol.split('/')[0].upper().strip()
+            coin = self._coin(symbol)
             
             # Verify coin exists
             if coin not in self.available_pairs:
                 logger.warning(f"Symbol {coin} not found in available pairs")
                 return {"bids": [], "asks": []}
             
-            # Get orderbook using the alternative method that works
-            orderbook_data = {
-                "type": "l2Book",
-                "coin": coin,
-                "depth": 10  # Get top 10 levels
-            }
-            
-            orderbook = self.info.post("/info", orderbook_data)
+            received_at, orderbook = self._books.get(coin, (None, None))
+            if not self._is_fresh(received_at):
+                if coin not in self._books:
+                    # Start streaming this book for subsequent calls (only attempted once per coin)
+                    self._books[coin] = (None, None)
+                    try:
+                        self.info.subscribe({"type": "l2Book", "coin": coin}, self._on_l2_book)
+                    except Exception as e:
+                        logger.warning(f"Orderbook stream unavailable for {coin}, using REST: {str(e)}")
+                
+                # Get orderbook using the alternative method that works
+                orderbook_data = {
+                    "type": "l2Book",
+                    "coin": coin,
+                    "depth": 10  # Get top 10 levels
+                }
+                
+                orderbook = self.info.post("/info", orderbook_data)
             
             # Format the orderbook to match the expected structure
             formatted_bids = []
@@ -1,11 +1,37 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
 from common.utils.logger import setup_logger
+from dataclasses import dataclass
 import time
 import random
-import uuid
+import secrets
 
 logger = setup_logger(__name__)
 
+@dataclass
+class MockOrder:
+    """Open order held by the mock exchange."""
+    __slots__ = ('id', 'symbol', 'side', 'amount', 'price', 'status', 'timestamp')
+    
+    id: str
+    symbol: str
+    side: str
+    amount: float
+    price: float
+    status: str
+    timestamp: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the order in the dict shape used by the exchange clients."""
+        return {
+            'id': self.id,
+            'symbol': self.symbol,
+            'side': self.side,
+            'amount': self.amount,
+            'price': self.price,
+            'status': self.status,
+            'timestamp': self.timestamp
+        }
+
 class MockExchangeClient:
     """Mock exchange client for testing without API connectivity."""
     
@@ -21,113 +47,107 @@ class MockExchangeClient:
             'BTC': {'free': 0.1, 'used': 0.0, 'total': 0.1},
             'USDT': {'free': 5000.0, 'used': 0.0, 'total': 5000.0}
         }
-        self.open_orders = {}
+        self.open_orders: Dict[str, MockOrder] = {}
+        self._orders_by_symbol: Dict[str, Set[str]] = {}  # symbol -> open order IDs
+        self._symbol_parts: Dict[str, Tuple[str, str]] = {}  # symbol -> (base, quote)
         
         logger.info("Mock exchange client initialized")
     
+    def _split_symbol(self, symbol: str) -> Tuple[str, str]:
+        """Split a symbol like BTC/USDT into (base, quote), caching the result."""
+        parts = self._symbol_parts.get(symbol)
+        if parts is None:
+            base, _, quote = symbol.partition('/')
+            parts = self._symbol_parts[symbol] = (base, quote)
+        return parts
+    
     def get_ticker(self, symbol: str) -> Optional[float]:
         """Get current price for symbol."""
         # Simulate small price movement
         change = random.uniform(-0.001, 0.001)
         self.current_price *= (1 + change)
-        logger.info(f"Mock current price for {symbol}: {self.current_price}")
+        logger.info("Mock current price for %s: %s", symbol, self.current_price)
         return self.current_price
     
     def create_order(self, symbol: str, side: str, amount: float, price: float) -> Optional[Dict[str, Any]]:
         """Create limit order."""
-        order_id = f"mock-{uuid.uuid4().hex[:8]}"
+        order_id = f"mock-{secrets.token_hex(4)}"
         
         # Simulate balance update
-        symbol_parts = symbol.split('/')
-        base_currency = symbol_parts[0]  # BTC in BTC/USDT
-        quote_currency = symbol_parts[1]  # USDT in BTC/USDT
+        base_currency, quote_currency = self._split_symbol(symbol)  # BTC, USDT in BTC/USDT
         
-        order = {
-            'id': order_id,
-            'symbol': symbol,
-            'side': side.lower(),
-            'amount': amount,
-            'price': price,
-            'status': 'open',
-            'timestamp': int(time.time() * 1000)
-        }
+        order = MockOrder(
+            id=order_id,
+            symbol=symbol,
+            side=side.lower(),
+            amount=amount,
+            price=price,
+            status='open',
+            timestamp=int(time.time() * 1000)
+        )
         
-        # Update balances based on order
-        if side.lower() == 'buy':
-            cost = amount * price
-            # Lock quote currency (USDT for BTC/USDT)
-            if quote_currency in self.balances:
-                if self.balances[quote_currency]['free'] >= cost:
-                    self.balances[quote_currency]['free'] -= cost
-                    self.balances[quote_currency]['used'] += cost
-                else:
-                    logger.error(f"Insufficient {quote_currency} balance")
-                    return None
-        else:  # sell
-            # Lock base currency (BTC for BTC/USDT)
-            if base_currency in self.balances:
-                if self.balances[base_currency]['free'] >= amount:
-                    self.balances[base_currency]['free'] -= amount
-                    self.balances[base_currency]['used'] += amount
-                else:
-                    logger.error(f"Insufficient {base_currency} balance")
-                    return None
+        # Lock quote currency for buys (USDT for BTC/USDT), base currency for sells (BTC)
+        if order.side == 'buy':
+            locked_currency, locked_amount = quote_currency, amount * price
+        else:
+            locked_currency, locked_amount = base_currency, amount
+        
+        balance = self.balances.get(locked_currency)
+        if balance is not None:
+            if balance['free'] < locked_amount:
+                logger.error(f"Insufficient {locked_currency} balance")
+                return None
+            balance['free'] -= locked_amount
+            balance['used'] += locked_amount
         
         # Store order
         self.open_orders[order_id] = order
+        self._orders_by_symbol.setdefault(symbol, set()).add(order_id)
         
-        logger.info(f"Created mock {side} order: {order_id}")
-        return order
+        logger.info("Created mock %s order: %s", side, order_id)
+        return order.to_dict()
 
     def get_open_orders(self, symbol: str = None) -> List[Dict[str, Any]]:
         """Get all open orders for a symbol."""
-        orders = []
-        
-        for order_id, order in self.open_orders.items():
-            if symbol is None or order['symbol'] == symbol:
-                orders.append(order)
+        if symbol is None:
+            orders = [order.to_dict() for order in self.open_orders.values()]
+        else:
+            orders = [self.open_orders[order_id].to_dict() for order_id in self._orders_by_symbol.get(symbol, ())]
         
-        logger.info(f"Found {len(orders)} mock open orders")
+        logger.info("Found %d mock open orders", len(orders))
         return orders
 
     def cancel_all_orders(self, symbol: str) -> bool:
         """Cancel all open orders for a symbol."""
         cancelled = 0
-        order_ids_to_remove = []
-        
-        for order_id, order in self.open_orders.items():
-            if order['symbol'] == symbol:
-                order_ids_to_remove.append(order_id)
-                cancelled += 1
-                
-                # Return locked funds
-                symbol_parts = symbol.split('/')
-                base_currency = symbol_parts[0]
-                quote_currency = symbol_parts[1]
-                
-                if order['side'] == 'buy':
-                    cost = order['amount'] * order['price']
-                    if quote_currency in self.balances:
-                        self.balances[quote_currency]['free'] += cost
-                        self.balances[quote_currency]['used'] -= cost
-                else:  # sell
-                    if base_currency in self.balances:
-                        self.balances[base_currency]['free'] += order['amount']
-                        self.balances[base_currency]['used'] -= order['amount']
+        base_currency, quote_currency = self._split_symbol(symbol)
+        base_balance = self.balances.get(base_currency)
+        quote_balance = self.balances.get(quote_currency)
         
-        # Remove cancelled orders
-        for order_id in order_ids_to_remove:
-            del self.open_orders[order_id]
+        for order_id in self._orders_by_symbol.pop(symbol, ()):
+            order = self.open_orders.pop(order_id)
+            cancelled += 1
+            
+            # Return locked funds
+            if order.side == 'buy':
+                balance, amount = quote_balance, order.amount * order.price
+            else:
+                balance, amount = base_balance, order.amount
+            
+            if balance is not None:
+                balance['free'] += amount
+                balance['used'] -= amount
         
-        logger.info(f"Cancelled {cancelled} mock orders")
+        logger.info("Cancelled %d mock orders", cancelled)
         return True
     
     def get_account_balance(self, currency: str = None) -> Dict[str, Any]:
         """Get account balance."""
         if currency:
-            if currency in self.balances:
-                logger.info(f"Mock {currency} balance: {self.balances[currency]['free']}")
-                return self.balances[currency]
+            balance = self.balances.get(currency)
+            if balance is not None:
+                logger.info(f"Mock {currency} balance: {balance['free']}")
+                return balance
             else:
                 logger.warning(f"Currency {currency} not found in mock balance")
                 return {'free': 0.0, 'used': 0.0, 'total': 0.0}
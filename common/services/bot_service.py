@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, List
+from common.database import connection
 from common.database.models import Bot, Client, Trade
 from common.exchange.client import ExchangeClient
 from common.bot.grid_bot import GridBot
@@ -6,14 +7,34 @@ from common.utils.logger import setup_logger
 from datetime import datetime
 from common.bot.price_monitor import PriceMonitor
 import os
+import threading
+import time
 
 logger = setup_logger(__name__)
 
 class BotService:
     def __init__(self):
+        # active_bots and _bots_by_pair are copy-on-write: writers build a new dict under
+        # _bots_lock and swap the reference, so readers never need the lock
         self.active_bots: Dict[int, GridBot] = {}
         self.price_monitor = PriceMonitor()
         self.price_monitor.start()
+        
+        # Bots grouped by pair so one price tick fans out to every bot trading it
+        self._bots_by_pair: Dict[str, Dict[int, GridBot]] = {}
+        self._bot_pairs: Dict[int, str] = {}
+        self._bots_lock = threading.Lock()
+        
+        # Trades are buffered and committed in batches rather than one commit per fill
+        self.trade_bulk_size = int(os.environ.get('TRADE_BULK_SIZE', '200'))
+        self.trade_commit_interval = int(os.environ.get('TRADE_COMMIT_INTERVAL_MS', '500')) / 1000
+        # Fills are buffered as (bot_id, time_ns, amount, profit); Trade rows are built at flush
+        self._pending_trades: List[tuple] = []
+        self._pending_session = None
+        self._pending_lock = threading.Lock()
+        self._last_trade_flush = time.monotonic()
+        # Commits a lone fill once trade_commit_interval passes without another one
+        self._flush_timer: Optional[threading.Timer] = None
     
     def start_bot(self, bot: Bot, client: Client) -> bool:
         """Start a grid trading bot."""
@@ -43,36 +64,68 @@ class BotService:
             )
             grid_bot.start()
             
-            # Add to price monitoring
-            self.price_monitor.add_symbol(bot.pair)
-            
-            # Store active bot
-            self.active_bots[bot.bot_id] = grid_bot
+            with self._bots_lock:
+                # Store active bot
+                self.active_bots = {**self.active_bots, bot.bot_id: grid_bot}
+                
+                # Add to price monitoring; the first bot on a pair subscribes for all of them
+                pair_bots = self._bots_by_pair.get(bot.pair, {})
+                if not pair_bots:
+                    self.price_monitor.add_symbol(bot.pair, self._dispatch_tick)
+                self._bots_by_pair = {**self._bots_by_pair, bot.pair: {**pair_bots, bot.bot_id: grid_bot}}
+                self._bot_pairs[bot.bot_id] = bot.pair
             return True
             
         except Exception as e:
-            logger.error(f"Failed to start bot {bot.bot_id}: {str(e)}")
+            logger.error("Failed to start bot %s: %s", bot.bot_id, e)
             return False
     
     def stop_bot(self, bot_id: int) -> bool:
         """Stop a grid trading bot."""
         try:
-            if bot_id in self.active_bots:
-                self.active_bots[bot_id].stop()
-                del self.active_bots[bot_id]
-                return True
-            return False
+            bot = self.active_bots.get(bot_id)
+            if bot is None:
+                return False
+            
+            bot.stop()
+            
+            with self._bots_lock:
+                active_bots = dict(self.active_bots)
+                active_bots.pop(bot_id, None)
+                self.active_bots = active_bots
+                
+                # Stop monitoring the pair once its last bot is gone
+                pair = self._bot_pairs.pop(bot_id, None)
+                if pair in self._bots_by_pair:
+                    bots_by_pair = dict(self._bots_by_pair)
+                    pair_bots = {k: v for k, v in bots_by_pair[pair].items() if k != bot_id}
+                    if pair_bots:
+                        bots_by_pair[pair] = pair_bots
+                    else:
+                        del bots_by_pair[pair]
+                        self.price_monitor.remove_symbol(pair)
+                    self._bots_by_pair = bots_by_pair
+            return True
             
         except Exception as e:
-            logger.error(f"Failed to stop bot {bot_id}: {str(e)}")
+            logger.error("Failed to stop bot %s: %s", bot_id, e)
             return False
     
+    def _dispatch_tick(self, pair: str, price: float):
+        """Forward a price update to every bot trading the pair."""
+        # The per-pair dicts are never mutated in place, so iterating one needs no lock
+        for bot in self._bots_by_pair.get(pair, {}).values():
+            try:
+                bot.on_price(price)
+            except Exception as e:
+                logger.error("Error dispatching price to bot: %s", e)
+    
     def get_bot_status(self, bot_id: int) -> Optional[dict]:
         """Get current bot status."""
-        if bot_id not in self.active_bots:
+        bot = self.active_bots.get(bot_id)
+        if bot is None:
             return None
-            
-        bot = self.active_bots[bot_id]
+        
         return {
             'bot_id': bot.bot_id,
             'pair': bot.pair,
@@ -83,28 +136,92 @@ class BotService:
     def handle_order_fill(self, bot_id: int, order_id: str, fill_price: float, fill_amount: float, session) -> bool:
         """Handle order fill event and record trade."""
         try:
-            if bot_id not in self.active_bots:
-                logger.warning(f"Order fill for inactive bot: {bot_id}")
+            bot = self.active_bots.get(bot_id)
+            if bot is None:
+                logger.warning("Order fill for inactive bot: %s", bot_id)
                 return False
             
-            bot = self.active_bots[bot_id]
             bot.handle_order_fill(order_id, fill_price, fill_amount)
             
             # Record trade in database
-            trade = Trade(
-                bot_id=bot_id,
-                timestamp=datetime.now(),
-                amount_btc=fill_amount,
-                profit_btc=bot.calculate_profit()
-            )
-            session.add(trade)
-            session.commit()
+            trade = (bot_id, time.time_ns(), fill_amount, bot.realized_profit)
+            with self._pending_lock:
+                # Trades already buffered for another session are committed there first;
+                # if that fails they stay buffered and go out with this session instead
+                if self._pending_session is not None and self._pending_session is not session:
+                    self._flush_trades_locked()
+                self._pending_session = session
+                self._pending_trades.append(trade)
+                
+                if (len(self._pending_trades) >= self.trade_bulk_size or
+                        time.monotonic() - self._last_trade_flush >= self.trade_commit_interval):
+                    self._flush_trades_locked()
+                self._schedule_flush_locked()
             return True
             
         except Exception as e:
-            logger.error(f"Failed to handle order fill: {str(e)}")
+            logger.error("Failed to handle order fill: %s", e)
             return False
     
+    def flush_trades(self) -> bool:
+        """Commit any buffered trades."""
+        with self._pending_lock:
+            return self._flush_trades_locked()
+    
+    def _schedule_flush_locked(self):
+        """Arm the flush timer while trades are buffered. Caller must hold _pending_lock."""
+        if self._flush_timer is None and self._pending_trades:
+            self._flush_timer = threading.Timer(self.trade_commit_interval, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _timed_flush(self):
+        """Timer callback: commit the buffer, re-arming if the commit failed."""
+        with self._pending_lock:
+            self._flush_timer = None
+            # The caller's session belongs to its thread; commit in one owned by this flush
+            self._pending_session = None
+            self._flush_trades_locked()
+            self._schedule_flush_locked()
+    
+    def _flush_trades_locked(self) -> bool:
+        """Commit buffered trades in one transaction. Caller must hold _pending_lock.
+        
+        On failure the trades stay buffered (the bot has already applied the
+        fills) and are retried by the next flush. Without a caller session the
+        batch is committed in a short-lived session of its own.
+        """
+        self._last_trade_flush = time.monotonic()
+        batch, session = self._pending_trades, self._pending_session
+        if not batch:
+            return True
+        
+        owned = session is None
+        if owned:
+            session = connection.get_session()
+        try:
+            session.add_all([
+                Trade(
+                    bot_id=bot_id,
+                    timestamp=datetime.fromtimestamp(ts_ns / 1e9),
+                    amount_btc=amount,
+                    profit_btc=profit
+                )
+                for bot_id, ts_ns, amount, profit in batch
+            ])
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error("Failed to commit %d trades, keeping them buffered: %s", len(batch), e)
+            return False
+        finally:
+            if owned:
+                session.close()
+        
+        self._pending_trades = []
+        self._pending_session = None
+        return True
+    
     def cleanup(self):
         """Clean up all resources."""
         try:
@@ -115,5 +232,12 @@ class BotService:
             for bot_id in list(self.active_bots.keys()):
                 self.stop_bot(bot_id)
             
+            # Record any trades still waiting for a batch commit
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                self._flush_trades_locked()
+            
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}") 
\ No newline at end of file
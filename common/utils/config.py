@@ -1,47 +1,74 @@
+import copy
 import os
 import yaml
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader
+
+# Parsed config files: path -> (modification time, config)
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
 def get_config() -> Dict[str, Any]:
-    """Load and return configuration from config.yaml."""
+    """Load and return configuration from config.yaml.
+    
+    The parsed file is cached until it changes; each call returns a deep
+    copy, so callers may modify the result without affecting later calls.
+    """
     config_path = os.getenv('CONFIG_PATH', 'config/config.yaml')
     
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found at {config_path}")
     
+    # Re-parse only when the file has changed since it was last loaded
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return copy.deepcopy(cached[1])
+    
     try:
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
             
         if not isinstance(config, dict):
             raise ValueError("Invalid configuration format")
-            
-        return config
+        
+        _CONFIG_CACHE[config_path] = (mtime, config)
+        return copy.deepcopy(config)
     except yaml.YAMLError as e:
         raise ValueError(f"Error parsing configuration file: {str(e)}")
 
-def get_env_config() -> Dict[str, Any]:
-    """Get configuration from environment variables."""
-    return {
-        'database': {
+@lru_cache(maxsize=1)
+def get_env_config() -> Mapping[str, Any]:
+    """Get configuration from environment variables.
+    
+    Read once per process and returned read-only, nested sections included;
+    call get_env_config.cache_clear() after changing the environment (e.g. in tests).
+    """
+    return MappingProxyType({
+        'database': MappingProxyType({
             'url': os.getenv('DATABASE_URL'),
             'pool_size': int(os.getenv('DATABASE_POOL_SIZE', '5')),
             'max_overflow': int(os.getenv('DATABASE_MAX_OVERFLOW', '10'))
-        },
-        'redis': {
+        }),
+        'redis': MappingProxyType({
             'url': os.getenv('REDIS_URL'),
             'db': int(os.getenv('REDIS_DB', '0'))
-        },
-        'rabbitmq': {
+        }),
+        'rabbitmq': MappingProxyType({
             'url': os.getenv('RABBITMQ_URL'),
             'exchange': os.getenv('RABBITMQ_EXCHANGE', 'gridbot')
-        },
-        'binance': {
+        }),
+        'binance': MappingProxyType({
             'testnet': os.getenv('BINANCE_TESTNET', 'true').lower() == 'true',
             'timeout': int(os.getenv('BINANCE_TIMEOUT', '10000'))
-        },
-        'telegram': {
+        }),
+        'telegram': MappingProxyType({
             'bot_token': os.getenv('TELEGRAM_BOT_TOKEN'),
             'chat_id': os.getenv('TELEGRAM_CHAT_ID')
-        }
-    } 
\ No newline at end of file
+        })
+    }) 
\ No newline at end of file
@@ -1,4 +1,5 @@
 from cryptography.fernet import Fernet
+from functools import lru_cache
 import os
 from common.utils.config import get_config
 
@@ -12,16 +13,19 @@ def get_encryption_key() -> bytes:
         raise ValueError("Encryption key not found in environment or config")
     return key.encode()
 
+@lru_cache(maxsize=4)
+def _get_cipher(cipher_key: bytes) -> Fernet:
+    """Get a Fernet cipher for the key, built once per distinct key."""
+    return Fernet(cipher_key)
+
 def encrypt_key(key: str) -> str:
     """Encrypt API key using Fernet."""
-    cipher_key = get_encryption_key()
-    f = Fernet(cipher_key)
+    f = _get_cipher(get_encryption_key())
     encrypted = f.encrypt(key.encode())
     return encrypted.decode()
 
 def decrypt_key(encrypted_key: str) -> str:
     """Decrypt API key using Fernet."""
-    cipher_key = get_encryption_key()
-    f = Fernet(cipher_key)
+    f = _get_cipher(get_encryption_key())
     decrypted = f.decrypt(encrypted_key.encode())
     return decrypted.decode() 
\ No newline at end of file
@@ -8,18 +8,9 @@ def calculate_grid_orders(capital: float, levels: list[float]) -> list[dict]:
     order_amount = capital / (len(levels) - 1)
     orders = []
     
-    for i in range(len(levels) - 1):
-        # Buy order at lower level
-        orders.append({
-            'side': 'buy',
-            'price': levels[i],
-            'amount': order_amount
-        })
-        # Sell order at upper level
-        orders.append({
-            'side': 'sell',
-            'price': levels[i + 1],
-            'amount': order_amount
-        })
+    # Pair each level with the next: buy at the lower one, sell at the upper one
+    for buy_price, sell_price in zip(levels, levels[1:]):
+        orders.append({'side': 'buy', 'price': buy_price, 'amount': order_amount})
+        orders.append({'side': 'sell', 'price': sell_price, 'amount': order_amount})
     
     return orders 
\ No newline at end of file
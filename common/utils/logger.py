@@ -2,6 +2,25 @@ import logging
 import sys
 from typing import Optional
 import os
+import time
+
+class FastFormatter(logging.Formatter):
+    """Formatter that renders the date/time part of asctime once per second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_time_str = ''
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time_str = time.strftime(self.default_time_format, self.converter(second))
+            self._last_second = second
+        return self.default_msec_format % (self._last_time_str, record.msecs)
 
 def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """Set up and return a logger instance."""
@@ -13,7 +32,7 @@ def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     # Avoid adding handlers if they already exist
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
+        formatter = FastFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         handler.setFormatter(formatter)
@@ -0,0 +1,27 @@
+"""Utility functions for signing exchange API requests."""
+import hashlib
+import hmac
+from hmac import compare_digest
+from typing import Callable
+
+def make_signer(secret: str) -> Callable[[str], str]:
+    """Return a function that signs a query string with HMAC-SHA256 under secret.
+
+    The keyed HMAC is built once and copied per message, so repeated
+    signatures skip re-deriving the inner/outer key pads.
+
+    Never check a received signature against sign(message) with ==; use
+    verify_signature (or compare_digest) so the comparison is constant-time.
+    """
+    prototype = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+    def sign(message: str) -> str:
+        mac = prototype.copy()
+        mac.update(message.encode('utf-8'))
+        return mac.hexdigest()
+
+    return sign
+
+def verify_signature(sign: Callable[[str], str], message: str, signature: str) -> bool:
+    """Check a hex signature for message in constant time."""
+    return compare_digest(sign(message), signature)
@@ -1,11 +1,40 @@
 """Utility functions for handling symbol information and precision."""
-from typing import Dict, Any
+from decimal import Decimal, ROUND_DOWN
+from typing import Dict, Any, Tuple
 from common.utils.logger import setup_logger
+import time
 
 logger = setup_logger(__name__)
 
-def get_symbol_info(client, symbol):
-    """Get detailed symbol information to determine quantity precision."""
+# Instrument metadata changes rarely; keep fetched entries this many seconds
+SYMBOL_INFO_TTL = 300
+
+# (base_url, category, normalized symbol) -> (fetched_at, symbol info)
+_symbol_info_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+
+def _step_format(step) -> str:
+    """Format spec with as many decimals as the step size has."""
+    return f".{len(str(step).split('.')[-1])}f"
+
+def _floor_to_step(value, step: Decimal) -> Decimal:
+    """Round value down to a whole number of steps without float error."""
+    steps = (Decimal(str(value)) / step).to_integral_value(rounding=ROUND_DOWN)
+    return steps * step
+
+def _with_formats(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Add precomputed format specs and decimal steps so adjustments skip re-deriving them."""
+    info["qty_fmt"] = _step_format(info["qty_step"])
+    info["price_fmt"] = _step_format(info["price_step"])
+    info["qty_step_dec"] = Decimal(str(info["qty_step"]))
+    info["price_step_dec"] = Decimal(str(info["price_step"]))
+    return info
+
+def get_symbol_info(client, symbol, force_refresh=False):
+    """Get detailed symbol information to determine quantity precision.
+    
+    Successful lookups are cached for SYMBOL_INFO_TTL seconds; pass
+    force_refresh=True to bypass the cache.
+    """
     try:
         # Extract base and quote currencies - handle both formats
         if "/" in symbol:
@@ -26,6 +55,11 @@ def get_symbol_info(client, symbol):
         category = client._detect_symbol_category(symbol)
         normalized_symbol = client._normalize_symbol(symbol)
         
+        cache_key = (client.base_url, category, normalized_symbol)
+        cached = _symbol_info_cache.get(cache_key)
+        if not force_refresh and cached is not None and time.monotonic() - cached[0] < SYMBOL_INFO_TTL:
+            return {**cached[1], "symbol": symbol}
+        
         params = {
             "category": category,
             "symbol": normalized_symbol
@@ -49,34 +83,36 @@ def get_symbol_info(client, symbol):
             min_price = float(filters.get("priceFilter", {}).get("minPrice", "0.01"))
             price_step = float(filters.get("priceFilter", {}).get("tickSize", "0.01"))
             
-            return {
+            result = _with_formats({
                 "symbol": symbol,
                 "min_qty": min_qty,
                 "qty_step": qty_step,
                 "min_price": min_price,
                 "price_step": price_step,
                 "info": symbol_info
-            }
+            })
+            _symbol_info_cache[cache_key] = (time.monotonic(), result)
+            return result
         
         # Fallback to default values
         logger.warning(f"Could not get precise symbol info for {symbol}, using defaults")
-        return {
+        return _with_formats({
             "symbol": symbol,
             "min_qty": 0.001,  # Default min BTC quantity
             "qty_step": 0.001, # Default BTC step
             "min_price": 0.5,  # Default min price step
             "price_step": 0.5  # Default price step
-        }
+        })
     
     except Exception as e:
         logger.error(f"Error getting symbol info: {str(e)}")
-        return {
+        return _with_formats({
             "symbol": symbol,
             "min_qty": 0.001,  # Default min BTC quantity
             "qty_step": 0.001, # Default BTC step
             "min_price": 0.5,  # Default min price step
             "price_step": 0.5  # Default price step
-        }
+        })
 
 def adjust_quantity(amount, symbol_info):
     """Adjust quantity to match exchange requirements."""
@@ -86,26 +122,16 @@ def adjust_quantity(amount, symbol_info):
     # Ensure minimum quantity
     amount = max(amount, min_qty)
     
-    # Round to valid step size
-    steps = round(amount / qty_step)
-    amount = steps * qty_step
-    
-    # Format to appropriate precision
-    precision = len(str(qty_step).split('.')[-1])
-    formatted_amount = format(amount, f'.{precision}f')
-    
-    return formatted_amount
+    # Round down to a valid step size so the order never exceeds the requested amount
+    qty_fmt = symbol_info.get("qty_fmt") or _step_format(qty_step)
+    qty_step_dec = symbol_info.get("qty_step_dec") or Decimal(str(qty_step))
+    return format(_floor_to_step(amount, qty_step_dec), qty_fmt)
 
 def adjust_price(price, symbol_info):
     """Adjust price to match exchange requirements."""
     price_step = symbol_info["price_step"]
     
-    # Round to valid price step
-    steps = round(price / price_step)
-    price = steps * price_step
-    
-    # Format to appropriate precision
-    precision = len(str(price_step).split('.')[-1])
-    formatted_price = format(price, f'.{precision}f')
-    
-    return formatted_price 
\ No newline at end of file
+    # Round down to a valid price step and format to the step's precision
+    price_fmt = symbol_info.get("price_fmt") or _step_format(price_step)
+    price_step_dec = symbol_info.get("price_step_dec") or Decimal(str(price_step))
+    return format(_floor_to_step(price, price_step_dec), price_fmt) 
\ No newline at end of file
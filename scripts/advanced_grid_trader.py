@@ -16,11 +16,19 @@ import requests
 import json
 import threading
 import signal
+import queue
+import asyncio
+import heapq
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from common.exchange.futures_client import FuturesExchangeClient
+from common.exchange.futures_client_async import AsyncFuturesExchangeClient
 from scripts.grid_trade_monitor import (
     get_binance_server_time, 
     get_binance_futures_symbol_info, 
@@ -38,7 +46,44 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=8)
+def _shared_client(api_key, api_secret, testnet):
+    """One FuturesExchangeClient per account, shared by every GridTrader trading on it."""
+    return FuturesExchangeClient(api_key, api_secret, testnet=testnet)
+
+# (symbol, testnet) -> symbol info; failed lookups aren't cached so they are retried
+_symbol_info_cache = {}
+_symbol_info_lock = threading.Lock()
+
+def _get_symbol_info(symbol, testnet):
+    """Download exchange info for a symbol once per process."""
+    key = (symbol, testnet)
+    with _symbol_info_lock:
+        symbol_info = _symbol_info_cache.get(key)
+        if symbol_info is None:
+            symbol_info = get_binance_futures_symbol_info(symbol, testnet=testnet)
+            if symbol_info:
+                _symbol_info_cache[key] = symbol_info
+    return symbol_info
+
 class GridTrader:
+    # Seconds between REST reconciliation passes while the event stream is live
+    RECONCILE_INTERVAL = 60
+    
+    # Seconds between REST polls when the event stream is unavailable
+    POLL_INTERVAL = 10
+    
+    # Seconds between listen key keepalives (Binance expires idle keys after 60 minutes)
+    LISTEN_KEY_KEEPALIVE = 30 * 60
+    
+    # Concurrent order submissions, and the rate/burst they are held to
+    ORDER_WORKERS = 8
+    ORDERS_PER_SECOND = 8
+    ORDER_BURST = 8
+    
+    # Seconds stop() waits for the cancel-all request before moving on
+    CANCEL_TIMEOUT = 2.0
+    
     def __init__(self, api_key, api_secret, symbol, capital, 
                  grid_count=3, range_percentage=2.0, testnet=True):
         self.api_key = api_key
@@ -50,10 +95,20 @@ class GridTrader:
         self.testnet = testnet
         
         # Initialize exchange client
-        self.exchange = FuturesExchangeClient(api_key, api_secret, testnet=testnet)
+        self.exchange = _shared_client(api_key, api_secret, testnet)
+        
+        # Reconcile reads run on the event loop through the asyncio client, opened by _run
+        self._async_exchange = None
         
         # Grid state
-        self.grid_orders = []
+        # Open grid orders keyed by order ID; filled ones move to filled_orders
+        self.grid_orders = {}
+        
+        # Running aggregates over open order prices for rebalancing. Heap entries are
+        # (price, id) / (-price, id) and are dropped lazily once the order leaves grid_orders
+        self._price_sum = 0.0
+        self._min_heap = []
+        self._max_heap = []
         self.filled_orders = []
         self.active_positions = []
         
@@ -64,6 +119,13 @@ class GridTrader:
         self.price_step = None
         self.usdt_per_grid = None
         
+        # (price, amount, notional) per initial grid level, sizing for any ladder index
+        # (including levels beyond the initial range), and sizing for off-ladder prices
+        # memoized by tick-snapped price string
+        self._levels = []
+        self._ladder = {}
+        self._level_sizes = {}
+        
         # Symbol constraints
         self.symbol_info = None
         self.min_qty = None
@@ -73,6 +135,21 @@ class GridTrader:
         
         # Running flag
         self.running = False
+        
+        # Fills and positions are pushed over a websocket and queued for the event
+        # worker; the grid state is shared between that worker and reconcile passes,
+        # never touched under the lock from the event loop itself
+        self._state_lock = threading.RLock()
+        self._events = queue.Queue()
+        self._event_worker = None
+        self._stream_live = False
+        
+        # Set when a fill may have changed positions; the next reconcile re-fetches them
+        self._positions_dirty = True
+        
+        # Shared by order-placing workers to pace submissions
+        self._throttle_lock = threading.Lock()
+        self._next_order_at = 0.0
     
     def initialize(self):
         """Initialize the grid trader with market data"""
@@ -85,7 +162,7 @@ class GridTrader:
         logger.info(f"Current price: {self.current_price}")
         
         # Get symbol info
-        self.symbol_info = get_binance_futures_symbol_info(self.symbol, testnet=self.testnet)
+        self.symbol_info = _get_symbol_info(self.symbol, self.testnet)
         if not self.symbol_info:
             logger.error(f"Failed to get symbol info for {self.symbol}")
             return False
@@ -138,143 +215,222 @@ class GridTrader:
         grid_steps = self.grid_count + 1
         self.price_step = (self.upper_price - self.lower_price) / grid_steps
         
+        # Snap and size every level once; orders are placed straight from this ladder
+        self._level_sizes = {}
+        self._ladder = {}
+        self._levels = [self._level(i) for i in range(self.grid_count)]
+        
         return True
     
-    def create_grid_orders(self):
-        """Create grid orders"""
-        logger.info("Creating grid orders...")
-        
-        created_orders = []
-        for i in range(self.grid_count):
-            # Calculate grid price
-            grid_price = self.lower_price + self.price_step * (i + 1)
-            grid_price_str = format_price(grid_price, self.tick_size)
-            
-            # Alternate buy/sell orders
-            side = "buy" if i % 2 == 0 else "sell"
+    def _level(self, index):
+        """Sizing for ladder level index, at lower_price + price_step * (index + 1)."""
+        sizing = self._ladder.get(index)
+        if sizing is None:
+            sizing = self._ladder[index] = self._size_level(self.lower_price + self.price_step * (index + 1))
+        return sizing
+    
+    def _level_index(self, price):
+        """Ladder index nearest to price."""
+        return round((price - self.lower_price) / self.price_step) - 1
+    
+    def _size_level(self, grid_price):
+        """Snap a grid price to the tick size and size its order.
+        
+        Returns (price, amount, notional) as floats, memoized per snapped price.
+        """
+        grid_price_str = format_price(grid_price, self.tick_size)
+        sizing = self._level_sizes.get(grid_price_str)
+        if sizing is None:
+            price = float(grid_price_str)
             
             # Calculate quantity
-            coin_quantity = self.usdt_per_grid / float(grid_price_str)
-            qty_needed = max(coin_quantity, self.min_notional / float(grid_price_str))
+            qty_needed = max(self.usdt_per_grid, self.min_notional) / price
             order_size_str = format_quantity(qty_needed, self.step_size, self.min_qty)
-            
-            # Calculate actual notional value
-            notional = float(order_size_str) * float(grid_price_str)
-            
-            logger.info(f"Creating {side} order at {grid_price_str} for {order_size_str} BTC (notional: {notional:.2f} USDT)")
+            notional = float(order_size_str) * price
             
             # Ensure we meet min notional
             if notional < self.min_notional:
-                logger.warning(f"Order notional too small. Adding buffer...")
-                qty_needed = self.min_notional / float(grid_price_str) * 1.01  # Add 1% buffer
+                logger.warning(f"Order notional too small at {grid_price_str}. Adding buffer...")
+                qty_needed = self.min_notional / price * 1.01  # Add 1% buffer
                 order_size_str = format_quantity(qty_needed, self.step_size, self.min_qty)
-                notional = float(order_size_str) * float(grid_price_str)
-                logger.info(f"New order: {order_size_str} BTC (notional: {notional:.2f} USDT)")
+                notional = float(order_size_str) * price
             
-            # Create order
-            try:
-                order = self.exchange.create_order(
-                    symbol=self.symbol,
-                    side=side,
-                    amount=float(order_size_str),
-                    price=float(grid_price_str)
-                )
-                
-                if order:
-                    logger.info(f"Created order: {order}")
-                    created_orders.append(order)
-                    
-                    # Add to grid orders
-                    grid_details = {
-                        'id': order['id'],
-                        'side': side,
-                        'price': float(grid_price_str),
-                        'amount': float(order_size_str),
-                        'notional': notional,
-                        'grid_index': i
-                    }
-                    self.grid_orders.append(grid_details)
-            except Exception as e:
-                logger.error(f"Error creating order: {str(e)}")
+            sizing = self._level_sizes[grid_price_str] = (price, float(order_size_str), notional)
+        return sizing
+    
+    def create_grid_orders(self):
+        """Create grid orders"""
+        logger.info("Creating grid orders...")
+        
+        orders = [{
+            'symbol': self.symbol,
+            'side': self._level_side(i),
+            'amount': amount,
+            'price': price
+        } for i, (price, amount, notional) in enumerate(self._levels)]
+        
+        # Levels go out through the batch endpoint, several batches in flight at once;
+        # _throttle keeps the burst within the exchange's order rate
+        batch_size = FuturesExchangeClient.MAX_BATCH_ORDERS
+        batches = [orders[start:start + batch_size] for start in range(0, len(orders), batch_size)]
+        workers = min(len(batches), self.ORDER_WORKERS) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = [order for batch in executor.map(self._place_batch, batches) for order in batch]
         
-        logger.info(f"Created {len(created_orders)} out of {self.grid_count} orders")
+        created_orders = []
+        for i, order in enumerate(results):
+            if order:
+                created_orders.append(order)
+                
+                # Add to grid orders
+                price, amount, notional = self._levels[i]
+                grid_details = {
+                    'id': order['id'],
+                    'side': self._level_side(i),
+                    'price': price,
+                    'amount': amount,
+                    'notional': notional,
+                    'grid_index': i
+                }
+                self._track_grid_order(grid_details)
+        
+        total_notional = sum(self._levels[i][2] for i, order in enumerate(results) if order)
+        logger.info("Created %d/%d orders (notional sum=%.2f USDT)", len(created_orders), self.grid_count, total_notional)
         return len(created_orders) > 0
     
-    def monitor_orders(self):
+    @staticmethod
+    def _level_side(i):
+        """Alternate buy/sell orders up the ladder."""
+        return "buy" if i % 2 == 0 else "sell"
+    
+    def _place_batch(self, orders):
+        """Place one batch of grid orders; returns results aligned with orders, None on failure."""
+        if logger.isEnabledFor(logging.DEBUG):
+            for order in orders:
+                logger.debug("Creating %s order at %s for %s BTC", order['side'], order['price'], order['amount'])
+        
+        self._throttle(len(orders))
+        try:
+            results = self.exchange.create_orders(orders)
+            for order in results:
+                if order:
+                    logger.debug("Created order: %s", order)
+            return results
+        except Exception as e:
+            logger.error(f"Error creating orders: {str(e)}")
+            return [None] * len(orders)
+    
+    def _throttle(self, count=1):
+        """Block until count more orders may be sent under ORDERS_PER_SECOND.
+        
+        Up to ORDER_BURST orders go out immediately after an idle period.
+        """
+        interval = 1 / self.ORDERS_PER_SECOND
+        with self._throttle_lock:
+            now = time.monotonic()
+            slot = max(self._next_order_at, now - (self.ORDER_BURST - 1) * interval)
+            self._next_order_at = slot + count * interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    async def monitor_orders(self):
         """Monitor orders and positions"""
+        # Positions only change on fills, so they are re-fetched only after one was seen.
+        # The flag is cleared before fetching so a fill seen meanwhile isn't lost
+        refresh_positions = self._positions_dirty
+        self._positions_dirty = False
         try:
-            # Get open orders
-            open_orders = self.exchange.get_open_orders(self.symbol)
-            open_order_ids = set(order['id'] for order in open_orders) if open_orders else set()
+            # Price (unless streamed), open orders and positions (if stale) are fetched concurrently
+            fetched_at = time.monotonic()
+            if self._stream_live:
+                price_fetch = asyncio.sleep(0, self.current_price)
+            else:
+                price_fetch = self._async_exchange.get_ticker(self.symbol)
+            if refresh_positions:
+                positions_fetch = asyncio.to_thread(get_account_positions, self.api_key, self.api_secret, testnet=self.testnet)
+            else:
+                positions_fetch = asyncio.sleep(0)
+            current_price, open_orders, positions = await asyncio.gather(
+                price_fetch,
+                self._async_exchange.get_open_orders(self.symbol),
+                positions_fetch
+            )
+            if refresh_positions and positions is None:
+                self._positions_dirty = True  # Fetch failed; retry next pass
             
-            logger.info(f"Open orders: {len(open_orders) if open_orders else 0}")
-            for order in open_orders or []:
-                logger.info(f"  Order {order['id']}: {order['side']} {order['amount']} @ {order['price']}")
+            # Applying may rebalance (blocking REST), so keep it off the event loop
+            await asyncio.to_thread(self._apply_snapshot, fetched_at, current_price, open_orders, positions)
+        
+        except Exception as e:
+            self._positions_dirty = self._positions_dirty or refresh_positions
+            logger.error(f"Error monitoring orders: {str(e)}")
+    
+    def _apply_snapshot(self, fetched_at, current_price, open_orders, positions):
+        """Reconcile grid state with a REST snapshot taken at fetched_at.
+        
+        positions is None when they weren't fetched; active_positions is kept as is.
+        """
+        with self._state_lock:
+            # Without the mark price stream, this is the one place the price is refreshed
+            self.current_price = current_price or self.current_price
             
-            # Check for filled orders
-            filled_orders = []
-            for grid_order in self.grid_orders:
-                if grid_order['id'] not in open_order_ids:
-                    logger.info(f"Order {grid_order['id']} filled or canceled!")
-                    filled_orders.append(grid_order)
+            open_order_ids = frozenset(order['id'] for order in open_orders or ())
             
-            # Remove filled orders from grid orders
-            for filled_order in filled_orders:
-                self.grid_orders = [order for order in self.grid_orders if order['id'] != filled_order['id']]
-                self.filled_orders.append(filled_order)
+            logger.info("Open orders: %d", len(open_order_ids))
+            # Per-order detail is only formatted when debug logging is on
+            if open_orders and logger.isEnabledFor(logging.DEBUG):
+                for order in open_orders:
+                    logger.debug("  Order %s: %s %s @ %s", order['id'], order['side'], order['amount'], order['price'])
             
-            # Get positions
-            positions = get_account_positions(self.api_key, self.api_secret, testnet=self.testnet)
-            self.active_positions = []
+            # Tracked orders missing from the open list were filled (or canceled). Orders
+            # placed after the snapshot was taken can't be in it, so they are skipped
+            filled_orders = []
+            for order_id in self.grid_orders.keys() - open_order_ids:
+                if self.grid_orders[order_id]['placed_at'] < fetched_at:
+                    logger.info(f"Order {order_id} filled or canceled!")
+                    filled_orders.append(self._take_grid_order(order_id))
+            if filled_orders:
+                self._positions_dirty = True
             
-            if positions:
-                for pos in positions:
-                    if float(pos.get('positionAmt', 0)) != 0:
-                        self.active_positions.append(pos)
+            # Update positions
+            if positions is not None:
+                self.active_positions = [pos for pos in positions if float(pos.get('positionAmt', 0)) != 0]
                 
                 if self.active_positions:
-                    logger.info("Active positions:")
-                    for pos in self.active_positions:
-                        symbol = pos.get('symbol', '')
-                        amount = float(pos.get('positionAmt', 0))
-                        entry_price = float(pos.get('entryPrice', 0))
-                        pnl = float(pos.get('unRealizedProfit', 0))
-                        
-                        logger.info(f"  {symbol}: {amount} @ {entry_price} (PnL: {pnl:.2f} USDT)")
+                    logger.info("Active positions: %d", len(self.active_positions))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for pos in self.active_positions:
+                            symbol = pos.get('symbol', '')
+                            amount = float(pos.get('positionAmt', 0))
+                            entry_price = float(pos.get('entryPrice', 0))
+                            pnl = float(pos.get('unRealizedProfit', 0))
+                            
+                            logger.debug("  %s: %s @ %s (PnL: %.2f USDT)", symbol, amount, entry_price, pnl)
                 else:
                     logger.info("No active positions")
             
             # Rebalance grid if needed
             if filled_orders and len(self.grid_orders) < self.grid_count:
                 logger.info("Rebalancing grid...")
-                self.rebalance_grid()
-        
-        except Exception as e:
-            logger.error(f"Error monitoring orders: {str(e)}")
+                self.rebalance_grid(self.current_price)
     
-    def rebalance_grid(self):
+    def rebalance_grid(self, current_price):
         """Rebalance the grid after orders are filled"""
-        # Get current price
-        current_price = self.exchange.get_ticker(self.symbol)
         if not current_price:
-            logger.error("Failed to get current price for rebalancing")
+            logger.error("No current price for rebalancing")
             return
         
-        logger.info(f"Current price for rebalancing: {current_price}")
-        
         # Calculate how many orders we need to create
         orders_needed = self.grid_count - len(self.grid_orders)
         if orders_needed <= 0:
             return
         
-        logger.info(f"Creating {orders_needed} new orders to rebalance grid")
+        logger.info("Creating %d new orders to rebalance grid at price %s", orders_needed, current_price)
         
         # Create new orders based on the current price and existing grid
         for i in range(orders_needed):
             # Determine if we need a buy or sell order based on price position
-            existing_prices = [order['price'] for order in self.grid_orders]
-            
-            if not existing_prices:
+            if not self.grid_orders:
                 # If no orders left, create a new grid centered on current price
                 range_factor = self.range_percentage / 200  # Half the range
                 new_lower = current_price * (1 - range_factor)
@@ -287,60 +443,49 @@ class GridTrader:
                 else:
                     grid_price = new_upper - price_step
                     side = "sell"
+                
+                price, amount, notional = self._size_level(grid_price)
+                level_index = self._level_index(price)
             else:
                 # Find optimal price level based on gaps in the grid
-                avg_price = sum(existing_prices) / len(existing_prices)
+                avg_price = self._price_sum / len(self.grid_orders)
                 
+                # Next free ladder slot past the current extreme, by index arithmetic
                 if current_price > avg_price:
                     # Create more sell orders above
                     side = "sell"
-                    grid_price = max(existing_prices) + self.price_step
+                    level_index = self._level_index(self._highest_price()) + 1
                 else:
                     # Create more buy orders below
                     side = "buy"
-                    grid_price = min(existing_prices) - self.price_step
-            
-            # Format price
-            grid_price_str = format_price(grid_price, self.tick_size)
-            
-            # Calculate quantity
-            coin_quantity = self.usdt_per_grid / float(grid_price_str)
-            qty_needed = max(coin_quantity, self.min_notional / float(grid_price_str))
-            order_size_str = format_quantity(qty_needed, self.step_size, self.min_qty)
-            
-            # Calculate actual notional value
-            notional = float(order_size_str) * float(grid_price_str)
-            
-            logger.info(f"Creating rebalance {side} order at {grid_price_str} for {order_size_str} BTC (notional: {notional:.2f} USDT)")
+                    level_index = self._level_index(self._lowest_price()) - 1
+                
+                price, amount, notional = self._level(level_index)
             
-            # Ensure we meet min notional
-            if notional < self.min_notional:
-                qty_needed = self.min_notional / float(grid_price_str) * 1.01  # Add 1% buffer
-                order_size_str = format_quantity(qty_needed, self.step_size, self.min_qty)
-                notional = float(order_size_str) * float(grid_price_str)
+            logger.debug("Creating rebalance %s order at %s for %s BTC (notional: %.2f USDT)", side, price, amount, notional)
             
             # Create order
             try:
                 order = self.exchange.create_order(
                     symbol=self.symbol,
                     side=side,
-                    amount=float(order_size_str),
-                    price=float(grid_price_str)
+                    amount=amount,
+                    price=price
                 )
                 
                 if order:
-                    logger.info(f"Created rebalance order: {order}")
+                    logger.debug("Created rebalance order: %s", order)
                     
                     # Add to grid orders
                     grid_details = {
                         'id': order['id'],
                         'side': side,
-                        'price': float(grid_price_str),
-                        'amount': float(order_size_str),
+                        'price': price,
+                        'amount': amount,
                         'notional': notional,
-                        'grid_index': i
+                        'grid_index': level_index
                     }
-                    self.grid_orders.append(grid_details)
+                    self._track_grid_order(grid_details)
             except Exception as e:
                 logger.error(f"Error creating rebalance order: {str(e)}")
     
@@ -367,32 +512,177 @@ class GridTrader:
         self.running = True
         logger.info("Grid trader started! Press Ctrl+C to cancel orders and exit.")
         
-        # Monitor loop
         try:
-            while self.running:
-                self.monitor_orders()
-                time.sleep(10)
+            asyncio.run(self._run())
         except KeyboardInterrupt:
             self.stop()
     
+    async def _run(self):
+        """Drive the event stream and the REST reconcile loop on one event loop."""
+        # Pushed events are handled on their own thread so nothing here blocks on the state lock
+        self._event_worker = threading.Thread(target=self._process_events, daemon=True)
+        self._event_worker.start()
+        
+        async with AsyncFuturesExchangeClient(self.api_key, self.api_secret, self.testnet) as self._async_exchange:
+            # Fills arrive over the event stream; the loop only reconciles against REST
+            stream = asyncio.create_task(self._stream_events())
+            try:
+                while self.running:
+                    await self.monitor_orders()
+                    await asyncio.sleep(self.RECONCILE_INTERVAL if self._stream_live else self.POLL_INTERVAL)
+            finally:
+                stream.cancel()
+    
+    async def _stream_events(self):
+        """Apply pushed events until the trader stops, reconnecting on errors."""
+        mark_price_stream = f"{self.symbol.replace('/', '').lower()}@markPrice"
+        
+        while self.running:
+            listen_key = await asyncio.to_thread(self.exchange.create_listen_key)
+            if listen_key:
+                url = f"{self.exchange.stream_url}/stream?streams={listen_key}/{mark_price_stream}"
+                try:
+                    async with aiohttp.ClientSession() as session:
+                        async with session.ws_connect(url, heartbeat=30) as ws:
+                            self._stream_live = True
+                            logger.info("Event stream connected")
+                            keepalive_at = time.monotonic() + self.LISTEN_KEY_KEEPALIVE
+                            
+                            async for msg in ws:
+                                if not self.running or msg.type != aiohttp.WSMsgType.TEXT:
+                                    break
+                                event = json.loads(msg.data)['data']
+                                if event.get('e') == 'listenKeyExpired':
+                                    break
+                                # Handling may rebalance (blocking REST), so it runs on the event worker
+                                self._events.put(event)
+                                
+                                if time.monotonic() >= keepalive_at:
+                                    await asyncio.to_thread(self.exchange.keepalive_listen_key)
+                                    keepalive_at = time.monotonic() + self.LISTEN_KEY_KEEPALIVE
+                except Exception as e:
+                    logger.error(f"Event stream error: {str(e)}")
+                finally:
+                    self._stream_live = False
+            
+            if self.running:
+                logger.warning("Event stream disconnected, polling REST until it reconnects")
+                await asyncio.sleep(5)
+    
+    def _process_events(self):
+        """Apply queued stream events off the event loop until the None sentinel."""
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            try:
+                self._on_stream_event(event)
+            except Exception as e:
+                logger.error(f"Error handling stream event: {str(e)}")
+    
+    def _on_stream_event(self, event):
+        """Update in-memory grid state from a single pushed event (event worker only)."""
+        event_type = event.get('e')
+        
+        if event_type == 'markPriceUpdate':
+            self.current_price = float(event['p'])
+        elif event_type == 'ORDER_TRADE_UPDATE':
+            order = event['o']
+            if order['X'] == 'FILLED':
+                with self._state_lock:
+                    filled_order = self._take_grid_order(str(order['i']))
+                if filled_order:
+                    logger.info(f"Order {filled_order['id']} filled!")
+                    self._positions_dirty = True
+                    self._rebalance_after_fill()
+        elif event_type == 'ACCOUNT_UPDATE':
+            self._apply_position_updates(event['a']['P'])
+    
+    def _track_grid_order(self, grid_details):
+        """Add an open order to grid_orders and the price aggregates."""
+        order_id, price = grid_details['id'], grid_details['price']
+        grid_details['placed_at'] = time.monotonic()
+        self.grid_orders[order_id] = grid_details
+        self._price_sum += price
+        heapq.heappush(self._min_heap, (price, order_id))
+        heapq.heappush(self._max_heap, (-price, order_id))
+    
+    def _take_grid_order(self, order_id):
+        """Move a grid order to filled_orders. Returns None if it isn't tracked."""
+        grid_order = self.grid_orders.pop(order_id, None)
+        if grid_order is not None:
+            self.filled_orders.append(grid_order)
+            # Reset on empty so float error doesn't accumulate across refills
+            self._price_sum = self._price_sum - grid_order['price'] if self.grid_orders else 0.0
+        return grid_order
+    
+    def _lowest_price(self):
+        """Lowest open order price (grid_orders must be non-empty)."""
+        while self._min_heap[0][1] not in self.grid_orders:
+            heapq.heappop(self._min_heap)
+        return self._min_heap[0][0]
+    
+    def _highest_price(self):
+        """Highest open order price (grid_orders must be non-empty)."""
+        while self._max_heap[0][1] not in self.grid_orders:
+            heapq.heappop(self._max_heap)
+        return -self._max_heap[0][0]
+    
+    def _apply_position_updates(self, updates):
+        """Merge ACCOUNT_UPDATE position changes into active_positions."""
+        with self._state_lock:
+            positions = {(pos.get('symbol'), pos.get('positionSide')): pos for pos in self.active_positions}
+            for update in updates:
+                positions[(update['s'], update['ps'])] = {
+                    'symbol': update['s'],
+                    'positionSide': update['ps'],
+                    'positionAmt': update['pa'],
+                    'entryPrice': update['ep'],
+                    'unRealizedProfit': update['up']
+                }
+            self.active_positions = [pos for pos in positions.values() if float(pos.get('positionAmt', 0)) != 0]
+    
+    def _rebalance_after_fill(self):
+        """Top the grid back up after a pushed fill."""
+        with self._state_lock:
+            if self.running and len(self.grid_orders) < self.grid_count:
+                logger.info("Rebalancing grid...")
+                self.rebalance_grid(self.current_price)
+    
     def stop(self):
         """Stop the grid trader"""
         logger.info("Stopping grid trader...")
         self.running = False
         
-        # Cancel all orders
-        try:
-            logger.info("Cancelling all orders...")
-            self.exchange.cancel_all_orders(self.symbol)
-            logger.info("Orders cancelled.")
-        except Exception as e:
-            logger.error(f"Error cancelling orders: {str(e)}")
+        # Let the event worker finish an in-flight rebalance so the cancel below also
+        # covers its orders; events still queued behind it no longer rebalance
+        self._events.put(None)
+        if self._event_worker is not None:
+            self._event_worker.join()
+            self._event_worker = None
+        
+        # Cancel all orders with one DELETE /fapi/v1/allOpenOrders, without letting a
+        # slow response hold up shutdown
+        logger.info("Cancelling all orders...")
+        cancel = threading.Thread(target=self._cancel_all_orders, daemon=True)
+        cancel.start()
+        cancel.join(timeout=self.CANCEL_TIMEOUT)
+        if cancel.is_alive():
+            logger.warning(f"Cancel request still pending after {self.CANCEL_TIMEOUT}s; check for open orders")
         
         logger.info("Grid trader stopped.")
         
         # Print summary
         self.print_summary()
     
+    def _cancel_all_orders(self):
+        """Cancel every open order for the symbol."""
+        try:
+            if self.exchange.cancel_all_orders(self.symbol):
+                logger.info("Orders cancelled.")
+        except Exception as e:
+            logger.error(f"Error cancelling orders: {str(e)}")
+    
     def print_summary(self):
         """Print trading summary"""
         logger.info("=== Grid Trading Summary ===")
@@ -403,9 +693,10 @@ class GridTrader:
         logger.info(f"Filled Orders: {len(self.filled_orders)}")
         
         if self.filled_orders:
-            logger.info("Order History:")
-            for order in self.filled_orders:
-                logger.info(f"  {order['side'].upper()} {order['amount']} @ {order['price']}")
+            # One record for the whole history rather than a log call per fill
+            logger.info("Order History:\n" + "\n".join(
+                f"  {order['side'].upper()} {order['amount']} @ {order['price']}" for order in self.filled_orders
+            ))
         
         # Calculate estimated P&L if possible
         if self.active_positions:
@@ -428,22 +719,34 @@ def main():
     args = parser.parse_args()
     
     try:
-        # Create exchange client
-        exchange = ExchangeFactory.create_exchange(
-            args.exchange,
-            args.api_key,
-            args.api_secret,
-            args.testnet
-        )
-        
-        # Create and run grid bot
-        bot = GridBot(
-            exchange=exchange,
-            symbol=args.pair,
-            capital=args.capital,
-            grid_count=args.grids,
-            range_percentage=args.range_percentage
-        )
+        if args.exchange == 'binance':
+            # Binance futures run on GridTrader's event-driven loop
+            bot = GridTrader(
+                args.api_key,
+                args.api_secret,
+                args.pair,
+                args.capital,
+                grid_count=args.grids,
+                range_percentage=args.range_percentage,
+                testnet=args.testnet
+            )
+        else:
+            # Create exchange client
+            exchange = ExchangeFactory.create_exchange(
+                args.exchange,
+                args.api_key,
+                args.api_secret,
+                args.testnet
+            )
+            
+            # Create and run grid bot
+            bot = GridBot(
+                exchange=exchange,
+                symbol=args.pair,
+                capital=args.capital,
+                grid_count=args.grids,
+                range_percentage=args.range_percentage
+            )
         
         bot.start()
         
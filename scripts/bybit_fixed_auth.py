@@ -6,6 +6,7 @@ import hmac
 import hashlib
 import time
 import json
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -14,22 +15,55 @@ from common.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+BASE_URL = "https://api-testnet.bybit.com"
+
+# One keep-alive session so the server-time and auth requests share a TLS connection
+_SESSION = requests.Session()
+
+# Seconds before the server/local clock offset is measured again
+OFFSET_MAX_AGE = 600
+
+# Server minus local clock in ms, and when it was measured (time.monotonic())
+_SERVER_OFFSET_MS: Optional[int] = None
+_OFFSET_FETCHED_AT = 0.0
+
+# Keyed HMAC prototypes per secret; copying one skips re-deriving the key pads per signature
+_HMAC_PROTOTYPES = {}
+
+def _signer(api_secret: str):
+    """Return a fresh HMAC-SHA256 object keyed with api_secret."""
+    prototype = _HMAC_PROTOTYPES.get(api_secret)
+    if prototype is None:
+        prototype = _HMAC_PROTOTYPES[api_secret] = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+    return prototype.copy()
+
+def _get_timestamp() -> Optional[str]:
+    """Return the server time in ms, fetching /v5/market/time only when the offset is stale."""
+    global _SERVER_OFFSET_MS, _OFFSET_FETCHED_AT
+    
+    if _SERVER_OFFSET_MS is None or time.monotonic() - _OFFSET_FETCHED_AT > OFFSET_MAX_AGE:
+        time_data = _SESSION.get(f"{BASE_URL}/v5/market/time").json()
+        result = time_data.get("result") or {}
+        if "timeNano" in result:
+            server_ms = int(result["timeNano"]) // 1_000_000
+        elif "timeSecond" in result:
+            server_ms = int(result["timeSecond"]) * 1000
+        else:
+            return None
+        _SERVER_OFFSET_MS = server_ms - time.time_ns() // 1_000_000
+        _OFFSET_FETCHED_AT = time.monotonic()
+    
+    return str(time.time_ns() // 1_000_000 + _SERVER_OFFSET_MS)
+
 def test_fixed_auth(api_key, api_secret):
     """Test Bybit auth with the format from the error message."""
     logger.info("=== Testing Bybit Authentication with Fixed Format ===")
     logger.info(f"API Key: {api_key}")
     
-    # First get server time
-    base_url = "https://api-testnet.bybit.com"
-    
+    # Server time, derived from a cached clock offset
     try:
-        time_url = f"{base_url}/v5/market/time"
-        time_response = requests.get(time_url)
-        time_data = time_response.json()
-        
-        if "result" in time_data and "timeSecond" in time_data["result"]:
-            # Use server time
-            timestamp = time_data["result"]["timeSecond"] + "000"  # Add milliseconds
+        timestamp = _get_timestamp()
+        if timestamp:
             logger.info(f"Using server time: {timestamp}")
         else:
             logger.error("Failed to get server time")
@@ -45,11 +79,9 @@ def test_fixed_auth(api_key, api_secret):
         
         logger.info(f"Using origin string for signature: {origin_string}")
         
-        signature = hmac.new(
-            bytes(api_secret, "utf-8"),
-            bytes(origin_string, "utf-8"),
-            hashlib.sha256
-        ).hexdigest()
+        mac = _signer(api_secret)
+        mac.update(origin_string.encode("utf-8"))
+        signature = mac.hexdigest()
         
         logger.info(f"Generated signature: {signature}")
         
@@ -62,12 +94,12 @@ def test_fixed_auth(api_key, api_secret):
         }
         
         # Make request
-        url = f"{base_url}{endpoint}"
+        url = f"{BASE_URL}{endpoint}"
         
         logger.info(f"Making request to: {url}")
         logger.info(f"With headers: {json.dumps(headers, indent=2)}")
         
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers)
         logger.info(f"Response status code: {response.status_code}")
         logger.info(f"Response content: {response.text}")
         
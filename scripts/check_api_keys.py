@@ -8,22 +8,26 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from sqlalchemy import func, select
+
 from common.database.connection import get_session
 from common.database.models import Client
 
-# First, let's examine crypto module functions
-from common.utils import crypto
-print("Available functions in crypto module:", dir(crypto))
-
 def main():
+    # Examine crypto module functions when asked to
+    if os.environ.get('DEBUG_CRYPTO'):
+        from common.utils import crypto
+        print("Available functions in crypto module:", dir(crypto))
+    
     # Connect to database
     session = get_session()
     
-    # Get all clients
-    clients = session.query(Client).all()
+    # Count up front, then stream clients in chunks instead of loading them all
+    client_count = session.scalar(select(func.count()).select_from(Client))
+    stmt = select(Client).execution_options(yield_per=500)
     
-    print(f"\nFound {len(clients)} clients in database:")
-    for client in clients:
+    print(f"\nFound {client_count} clients in database:")
+    for client in session.scalars(stmt):
         try:
             # Show encrypted data (raw from database)
             print(f"Client ID: {client.client_id}")
@@ -4,19 +4,51 @@ Check GridBot parameters
 """
 import sys
 import os
+import hashlib
+import importlib.util
 import inspect
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from common.bot.grid_bot import GridBot
+# The report only changes when grid_bot.py does, so it is cached by the source hash
+# and the (slow) GridBot import chain is skipped on repeat runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'smooth-treasury')
 
-# Inspect GridBot constructor
-signature = inspect.signature(GridBot.__init__)
-print("GridBot constructor parameters:")
-for name, param in signature.parameters.items():
-    print(f"  {name}: {param.default}")
+def build_report():
+    """Inspect GridBot's constructor and return the printable report."""
+    from common.bot.grid_bot import GridBot
 
-# Print the source code of the constructor
-print("\nGridBot constructor source code:")
-print(inspect.getsource(GridBot.__init__)) 
\ No newline at end of file
+    # Inspect GridBot constructor
+    signature = inspect.signature(GridBot.__init__)
+    lines = ["GridBot constructor parameters:"]
+    for name, param in signature.parameters.items():
+        lines.append(f"  {name}: {param.default}")
+
+    # Print the source code of the constructor
+    lines.append("\nGridBot constructor source code:")
+    lines.append(inspect.getsource(GridBot.__init__))
+    return "\n".join(lines)
+
+def main():
+    src_path = importlib.util.find_spec('common.bot.grid_bot').origin
+    with open(src_path, 'rb') as f:
+        key = hashlib.sha256(f.read()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"gridbot_sig_{key}.txt")
+
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            print(f.read())
+        return
+
+    report = build_report()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            f.write(report)
+    except OSError:
+        pass  # Caching is best effort
+    print(report)
+
+if __name__ == "__main__":
+    main()
@@ -14,65 +14,68 @@ from common.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-# Parse arguments
-parser = argparse.ArgumentParser(description='Close all open positions on Bybit')
-parser.add_argument('--symbol', type=str, help='Symbol to close positions for (e.g. BTCUSD)')
-parser.add_argument('--testnet', action='store_true', help='Use testnet instead of mainnet')
-args = parser.parse_args()
-
-try:
-    # Initialize Bybit client
-    client = BybitClient(
-        api_key="bcRYdfdO4Z7INAFPcE",
-        api_secret="BmACyMG0LoWygr3p03fCv4E4fxrjtrsRsiir",
-        testnet=args.testnet
-    )
-    
-    # Get open positions
-    positions = client.get_positions(args.symbol)
-    
-    if not positions:
-        print(f"No open positions for {args.symbol or 'any symbol'}")
-        sys.exit(0)
-    
-    # Print positions to close
-    print(f"Found {len(positions)} open positions:")
-    for pos in positions:
-        print(f"  {pos['side']} {pos['amount']} {pos['symbol']} @ {pos['entry_price']}")
+def main(args):
+    # Get API credentials from environment variables
+    api_key = os.environ.get('BYBIT_API_KEY')
+    api_secret = os.environ.get('BYBIT_API_SECRET')
     
-    # Confirm with user
-    confirmation = input("Close these positions? (y/n): ")
-    if confirmation.lower() != 'y':
-        print("Operation cancelled")
-        sys.exit(0)
+    if not api_key or not api_secret:
+        logger.error("API key and secret must be set as environment variables: BYBIT_API_KEY and BYBIT_API_SECRET")
+        return
     
-    # Close each position
-    for position in positions:
-        size = position.get("amount", 0)
-        side = position.get("side", "")
-        symbol = position.get("symbol", "")
+    try:
+        # Initialize Bybit client
+        client = BybitClient(
+            api_key=api_key,
+            api_secret=api_secret,
+            testnet=args.testnet
+        )
         
-        if size <= 0 or not symbol:
-            continue
+        # Get open positions
+        positions = client.get_positions(args.symbol)
         
-        print(f"Closing {side} position of {size} {symbol}...")
+        if not positions:
+            print(f"No open positions for {args.symbol or 'any symbol'}")
+            return
         
-        # Create opposite order to close
-        close_side = "sell" if side == "long" else "buy"
+        # Print positions to close
+        print(f"Found {len(positions)} open positions:")
+        for pos in positions:
+            print(f"  {pos['side']} {pos['amount']} {pos['symbol']} @ {pos['entry_price']}")
         
-        # Place market order to close position
-        result = client.create_market_order(
-            symbol=symbol,
-            side=close_side,
-            amount=size
-        )
+        # Confirm with user
+        confirmation = input("Close these positions? (y/n): ")
+        if confirmation.lower() != 'y':
+            print("Operation cancelled")
+            return
         
-        if result:
-            print(f"Successfully closed position: {result.get('id', 'unknown')}")
-        else:
-            print(f"Failed to close position for {symbol}")
-    
-    print("Position closing complete!")
-    
-except Exception as e:
-    print(f"Error: {str(e)}") 
\ No newline at end of file
+        # Opposite-side market orders close the positions
+        closes = [{
+            "symbol": position.get("symbol", ""),
+            "side": "sell" if position.get("side", "") == "long" else "buy",
+            "amount": position.get("amount", 0)
+        } for position in positions if position.get("amount", 0) > 0 and position.get("symbol")]
+        
+        for close in closes:
+            print(f"Closing position of {close['amount']} {close['symbol']} with a {close['side']} order...")
+        
+        # Reduce-only closes go out in one batch request per category
+        results = client.create_batch_market_orders(closes)
+        
+        for close, result in zip(closes, results):
+            if result:
+                print(f"Successfully closed position: {result.get('id', 'unknown')}")
+            else:
+                print(f"Failed to close position for {close['symbol']}")
+        
+        print("Position closing complete!")
+        
+    except Exception as e:
+        print(f"Error: {str(e)}")
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description='Close all open positions on Bybit')
+    parser.add_argument('--symbol', type=str, help='Symbol to close positions for (e.g. BTCUSD)')
+    parser.add_argument('--testnet', action='store_true', help='Use testnet instead of mainnet')
+    main(parser.parse_args())
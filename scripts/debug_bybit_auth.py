@@ -1,22 +1,25 @@
 #!/usr/bin/env python
 import sys
 import os
-import hmac
-import hashlib
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from common.utils.logger import setup_logger
+from common.utils.signing import make_signer
 
 logger = setup_logger(__name__)
 
-def debug_auth(api_key, api_secret):
-    """Debug Bybit authentication with detailed output."""
+def debug_auth(session, api_key, api_secret):
+    """Debug Bybit authentication with detailed output.
+    
+    The session is expected to carry the X-BAPI-API-KEY header already.
+    """
     logger.info("==== Debugging Bybit Authentication ====")
     logger.info(f"API Key: {api_key}")
     
@@ -27,7 +30,7 @@ def debug_auth(api_key, api_secret):
     logger.info("\n1. Checking server time...")
     try:
         time_url = f"{base_url}/v5/market/time"
-        time_response = requests.get(time_url)
+        time_response = session.get(time_url)
         time_data = time_response.json()
         
         if time_data and "result" in time_data and "timeSecond" in time_data["result"]:
@@ -39,18 +42,22 @@ def debug_auth(api_key, api_secret):
             logger.info(f"Local time: {local_time}")
             logger.info(f"Time difference: {time_diff}ms")
             
-            # Use server time directly
-            timestamp = str(server_time)
+            # Keep the offset so signed requests follow server time
+            time_offset = -time_diff
         else:
             logger.error("Failed to get server time")
-            timestamp = str(int(time.time() * 1000))
+            time_offset = 0
     except Exception as e:
         logger.error(f"Error getting server time: {str(e)}")
-        timestamp = str(int(time.time() * 1000))
+        time_offset = 0
+    
+    def now_ms():
+        return int(time.time() * 1000) + time_offset
     
     # 2. Test GET request with proper server time
     logger.info("\n2. Testing GET request with server time...")
     recv_window = "20000"  # Use a large window to account for timing issues
+    timestamp = str(now_ms())
     
     # Endpoint & params
     endpoint = "/v5/account/wallet-balance"
@@ -64,17 +71,13 @@ def debug_auth(api_key, api_secret):
     logger.info(f"Param string: {param_str}")
     
     # Generate signature
-    signature = hmac.new(
-        bytes(api_secret, "utf-8"),
-        bytes(param_str, "utf-8"),
-        hashlib.sha256
-    ).hexdigest()
+    sign = make_signer(api_secret)
+    signature = sign(param_str)
     
     logger.info(f"Generated signature: {signature}")
     
     # Set headers
     headers = {
-        "X-BAPI-API-KEY": api_key,
         "X-BAPI-SIGN": signature,
         "X-BAPI-TIMESTAMP": timestamp,
         "X-BAPI-RECV-WINDOW": recv_window
@@ -87,7 +90,7 @@ def debug_auth(api_key, api_secret):
     logger.info(f"Headers: {json.dumps(headers, indent=2)}")
     
     try:
-        response = requests.get(url, headers=headers)
+        response = session.get(url, headers=headers)
         status_code = response.status_code
         response_text = response.text
         
@@ -119,7 +122,11 @@ def main():
     
     args = parser.parse_args()
     
-    debug_auth(args.api_key, args.api_secret)
+    # One keep-alive session for every call; the API key header is set once here
+    with requests.Session() as session:
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        session.headers.update({"X-BAPI-API-KEY": args.api_key})
+        debug_auth(session, args.api_key, args.api_secret)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,13 +2,19 @@
 """
 Direct trading test - minimal version that places real orders on testnet.
 """
+import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import time
-import hmac
-import hashlib
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from common.utils.signing import make_signer
 
 def main():
     if len(sys.argv) != 3:
@@ -18,176 +24,161 @@ def main():
     api_key = sys.argv[1]
     api_secret = sys.argv[2]
     
+    sign = make_signer(api_secret)
+    
     print(f"Testing trading with provided API keys...")
     
     # Base URLs for Binance Futures Testnet
     base_url = "https://testnet.binancefuture.com"
     
-    # 1. Get server time to avoid timestamp issues
-    time_url = f"{base_url}/fapi/v1/time"
-    print(f"\nGetting server time from: {time_url}")
-    
-    try:
-        response = requests.get(time_url)
-        if response.status_code == 200:
-            data = response.json()
-            server_time = data['serverTime']
-            print(f"Server time: {server_time}")
-            
-            # Calculate time difference
-            local_time = int(time.time() * 1000)
-            diff = local_time - server_time
-            print(f"Time difference: {diff}ms")
-        else:
-            print(f"Failed to get server time: {response.text}")
-            server_time = int(time.time() * 1000)
-    except Exception as e:
-        print(f"Error connecting to futures API: {str(e)}")
-        server_time = int(time.time() * 1000)
-    
-    # 2. Get current BTC price
-    ticker_url = f"{base_url}/fapi/v1/ticker/price?symbol=BTCUSDT"
-    print(f"\nFetching ticker from: {ticker_url}")
-    
-    try:
-        response = requests.get(ticker_url)
-        if response.status_code == 200:
-            data = response.json()
-            current_price = float(data['price'])
-            print(f"BTC/USDT price: {current_price}")
-        else:
-            print(f"Failed to get ticker: {response.text}")
+    # One keep-alive session for every call; the API key header is set once here
+    with requests.Session() as session:
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        session.headers.update({'X-MBX-APIKEY': api_key})
+        
+        # 1. Get server time to avoid timestamp issues, and 2. the current BTC price.
+        # Both are independent public calls, so they are in flight together
+        time_url = f"{base_url}/fapi/v1/time"
+        ticker_url = f"{base_url}/fapi/v1/ticker/price?symbol=BTCUSDT"
+        print(f"\nGetting server time from: {time_url}")
+        print(f"Fetching ticker from: {ticker_url}")
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            time_future = executor.submit(session.get, time_url)
+            ticker_future = executor.submit(session.get, ticker_url)
+        
+        try:
+            response = time_future.result()
+            if response.status_code == 200:
+                data = response.json()
+                server_time = data['serverTime']
+                print(f"Server time: {server_time}")
+                
+                # Calculate time difference
+                local_time = int(time.time() * 1000)
+                diff = local_time - server_time
+                print(f"Time difference: {diff}ms")
+                time_offset = -diff
+            else:
+                print(f"Failed to get server time: {response.text}")
+                time_offset = 0
+        except Exception as e:
+            print(f"Error connecting to futures API: {str(e)}")
+            time_offset = 0
+        
+        # The offset is stable for minutes, so every signed call derives its timestamp locally
+        def now_ms():
+            return int(time.time() * 1000) + time_offset
+        
+        try:
+            response = ticker_future.result()
+            if response.status_code == 200:
+                data = response.json()
+                current_price = float(data['price'])
+                print(f"BTC/USDT price: {current_price}")
+            else:
+                print(f"Failed to get ticker: {response.text}")
+                return
+        except Exception as e:
+            print(f"Error fetching ticker: {str(e)}")
             return
-    except Exception as e:
-        print(f"Error fetching ticker: {str(e)}")
-        return
-    
-    # 3. Calculate grid price levels
-    print("\nCalculating grid price levels...")
-    lower_price = current_price * 0.95  # 5% below current price
-    upper_price = current_price * 1.05  # 5% above current price
-    
-    grid_count = 3
-    grid_step = (upper_price - lower_price) / grid_count
-    
-    grid_prices = []
-    for i in range(grid_count + 1):
-        price = lower_price + i * grid_step
-        grid_prices.append(round(price, 2))
-    
-    print(f"Grid prices: {grid_prices}")
-    
-    # 4. Place test buy limit order at lowest grid level
-    buy_price = grid_prices[0]
-    small_amount = 0.001  # Very small BTC amount
-    
-    order_id = f"test-{random.randint(1000, 9999)}"
-    print(f"\nPlacing test BUY order: {small_amount} BTC at ${buy_price}")
-    
-    # Prepare the order parameters
-    timestamp = server_time + 1000  # Add 1 second to ensure timestamp is valid
-    
-    params = {
-        'symbol': 'BTCUSDT',
-        'side': 'BUY',
-        'type': 'LIMIT',
-        'timeInForce': 'GTC',
-        'quantity': small_amount,
-        'price': buy_price,
-        'timestamp': timestamp,
-        'recvWindow': 5000,
-        'newClientOrderId': order_id
-    }
-    
-    # Sign the request
-    query_string = '&'.join([f"{key}={params[key]}" for key in params])
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        query_string.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-    
-    # Final URL with query string and signature
-    url = f"{base_url}/fapi/v1/order?{query_string}&signature={signature}"
-    
-    # Headers with API key
-    headers = {
-        'X-MBX-APIKEY': api_key
-    }
-    
-    try:
-        response = requests.post(url, headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            print("\n✅ Order placed successfully!")
-            print(json.dumps(data, indent=2))
-            
-            order_id = data['orderId']
-            
-            # Wait a moment to ensure the order is registered
-            time.sleep(2)
-            
-            # 5. Get the order status
-            print(f"\nChecking order status for order ID: {order_id}")
-            
-            timestamp = int(time.time() * 1000)
-            params = {
-                'symbol': 'BTCUSDT',
-                'orderId': order_id,
-                'timestamp': timestamp,
-                'recvWindow': 5000
-            }
-            
-            query_string = '&'.join([f"{key}={params[key]}" for key in params])
-            signature = hmac.new(
-                api_secret.encode('utf-8'),
-                query_string.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-            
-            url = f"{base_url}/fapi/v1/order?{query_string}&signature={signature}"
-            
-            response = requests.get(url, headers=headers)
+        
+        # 3. Calculate grid price levels
+        print("\nCalculating grid price levels...")
+        lower_price = current_price * 0.95  # 5% below current price
+        upper_price = current_price * 1.05  # 5% above current price
+        
+        grid_count = 3
+        grid_step = (upper_price - lower_price) / grid_count
+        
+        grid_prices = []
+        for i in range(grid_count + 1):
+            price = lower_price + i * grid_step
+            grid_prices.append(round(price, 2))
+        
+        print(f"Grid prices: {grid_prices}")
+        
+        # 4. Place test buy limit order at lowest grid level
+        buy_price = grid_prices[0]
+        small_amount = 0.001  # Very small BTC amount
+        
+        order_id = f"test-{random.randint(1000, 9999)}"
+        print(f"\nPlacing test BUY order: {small_amount} BTC at ${buy_price}")
+        
+        # Prepare the order parameters
+        timestamp = now_ms()
+        
+        params = {
+            'symbol': 'BTCUSDT',
+            'side': 'BUY',
+            'type': 'LIMIT',
+            'timeInForce': 'GTC',
+            'quantity': small_amount,
+            'price': buy_price,
+            'timestamp': timestamp,
+            'recvWindow': 5000,
+            'newClientOrderId': order_id
+        }
+        
+        # Sign the request
+        query_string = '&'.join([f"{key}={params[key]}" for key in params])
+        signature = sign(query_string)
+        
+        # Final URL with query string and signature
+        url = f"{base_url}/fapi/v1/order?{query_string}&signature={signature}"
+        
+        try:
+            response = session.post(url)
             if response.status_code == 200:
                 data = response.json()
-                print("\n✅ Order status retrieved successfully!")
+                print("\n✅ Order placed successfully!")
                 print(json.dumps(data, indent=2))
                 
-                # 6. Cancel the order to clean up
-                print(f"\nCancelling order ID: {order_id}")
+                order_id = data['orderId']
                 
-                timestamp = int(time.time() * 1000)
-                params = {
-                    'symbol': 'BTCUSDT',
-                    'orderId': order_id,
-                    'timestamp': timestamp,
-                    'recvWindow': 5000
-                }
+                # Status and cancel sign the same parameters; only the timestamp changes
+                prefix = f"symbol=BTCUSDT&orderId={order_id}&recvWindow=5000"
                 
-                query_string = '&'.join([f"{key}={params[key]}" for key in params])
-                signature = hmac.new(
-                    api_secret.encode('utf-8'),
-                    query_string.encode('utf-8'),
-                    hashlib.sha256
-                ).hexdigest()
+                # Wait a moment to ensure the order is registered
+                time.sleep(2)
+                
+                # 5. Get the order status
+                print(f"\nChecking order status for order ID: {order_id}")
+                
+                query_string = f"{prefix}&timestamp={now_ms()}"
+                signature = sign(query_string)
                 
                 url = f"{base_url}/fapi/v1/order?{query_string}&signature={signature}"
                 
-                response = requests.delete(url, headers=headers)
+                response = session.get(url)
                 if response.status_code == 200:
                     data = response.json()
-                    print("\n✅ Order cancelled successfully!")
+                    print("\n✅ Order status retrieved successfully!")
                     print(json.dumps(data, indent=2))
+                    
+                    # 6. Cancel the order to clean up
+                    print(f"\nCancelling order ID: {order_id}")
+                    
+                    query_string = f"{prefix}&timestamp={now_ms()}"
+                    signature = sign(query_string)
+                    
+                    url = f"{base_url}/fapi/v1/order?{query_string}&signature={signature}"
+                    
+                    response = session.delete(url)
+                    if response.status_code == 200:
+                        data = response.json()
+                        print("\n✅ Order cancelled successfully!")
+                        print(json.dumps(data, indent=2))
+                    else:
+                        print(f"\n❌ Failed to cancel order: {response.status_code} - {response.text}")
                 else:
-                    print(f"\n❌ Failed to cancel order: {response.status_code} - {response.text}")
+                    print(f"\n❌ Failed to get order status: {response.status_code} - {response.text}")
             else:
-                print(f"\n❌ Failed to get order status: {response.status_code} - {response.text}")
-        else:
-            print(f"\n❌ Failed to place order: {response.status_code} - {response.text}")
-    except Exception as e:
-        print(f"\n❌ Error placing order: {str(e)}")
-    
-    print("\nTest complete!")
+                print(f"\n❌ Failed to place order: {response.status_code} - {response.text}")
+        except Exception as e:
+            print(f"\n❌ Error placing order: {str(e)}")
+        
+        print("\nTest complete!")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -5,18 +5,26 @@ Comprehensive exchange connection tester
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import time
-import hmac
-import hashlib
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-def test_spot_connection(api_key, api_secret, testnet=True):
-    """Test Binance Spot API connection"""
-    print("\n===== TESTING BINANCE SPOT API =====")
+from common.utils.signing import make_signer
+
+def test_spot_connection(session, sign, testnet=True):
+    """Test Binance Spot API connection.
+    
+    Output is collected and returned rather than printed so the spot and
+    futures checks can run in parallel without interleaving.
+    """
+    lines = []
+    out = lines.append
+    out("\n===== TESTING BINANCE SPOT API =====")
     
     if testnet:
         base_url = "https://testnet.binance.vision"
@@ -24,38 +32,38 @@ def test_spot_connection(api_key, api_secret, testnet=True):
         base_url = "https://api.binance.com"
     
     # 1. Get server time first to sync timestamps
-    print("\nGetting server time...")
+    out("\nGetting server time...")
     try:
-        response = requests.get(f"{base_url}/api/v3/time")
+        response = session.get(f"{base_url}/api/v3/time")
         if response.status_code == 200:
             server_time = response.json()['serverTime']
-            print(f"Server time: {server_time}")
+            out(f"Server time: {server_time}")
             
             # Calculate time difference
             local_time = int(time.time() * 1000)
             diff = local_time - server_time
-            print(f"Time difference: {diff}ms")
+            out(f"Time difference: {diff}ms")
         else:
-            print(f"Failed to get server time: {response.text}")
+            out(f"Failed to get server time: {response.text}")
             server_time = int(time.time() * 1000)
     except Exception as e:
-        print(f"Error getting server time: {str(e)}")
+        out(f"Error getting server time: {str(e)}")
         server_time = int(time.time() * 1000)
     
     # 2. Test public endpoint (no auth)
-    print("\nTesting public endpoint (price)...")
+    out("\nTesting public endpoint (price)...")
     try:
-        response = requests.get(f"{base_url}/api/v3/ticker/price?symbol=BTCUSDT")
+        response = session.get(f"{base_url}/api/v3/ticker/price?symbol=BTCUSDT")
         if response.status_code == 200:
             data = response.json()
-            print(f"✅ Success! BTC price: {data['price']}")
+            out(f"✅ Success! BTC price: {data['price']}")
         else:
-            print(f"❌ Failed: {response.status_code} - {response.text}")
+            out(f"❌ Failed: {response.status_code} - {response.text}")
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        out(f"❌ Error: {str(e)}")
     
     # 3. Test private endpoint (requires auth) - using server time
-    print("\nTesting private endpoint (account)...")
+    out("\nTesting private endpoint (account)...")
     # Use server time slightly in the past to ensure it's not ahead
     timestamp = server_time - 500  # Subtract 500ms to be safe
     
@@ -65,44 +73,39 @@ def test_spot_connection(api_key, api_secret, testnet=True):
     }
     
     query_string = '&'.join([f"{key}={params[key]}" for key in params])
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        query_string.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    signature = sign(query_string)
     
     url = f"{base_url}/api/v3/account?{query_string}&signature={signature}"
-    headers = {
-        'X-MBX-APIKEY': api_key
-    }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = session.get(url)
         if response.status_code == 200:
             data = response.json()
             balances = {asset['asset']: float(asset['free']) for asset in data['balances'] if float(asset['free']) > 0}
-            print(f"✅ Success! Account connected.")
-            print(f"Balances: {json.dumps(balances, indent=2)}")
+            out(f"✅ Success! Account connected.")
+            out(f"Balances: {json.dumps(balances, indent=2)}")
         else:
-            print(f"❌ Failed: {response.status_code} - {response.text}")
-            print("\nPossible issues:")
+            out(f"❌ Failed: {response.status_code} - {response.text}")
+            out("\nPossible issues:")
             if "API-key format invalid" in response.text:
-                print("- API key format is invalid")
+                out("- API key format is invalid")
             elif "Signature" in response.text:
-                print("- Signature is incorrect (API secret might be wrong)")
+                out("- Signature is incorrect (API secret might be wrong)")
             elif "Invalid API-key" in response.text:
-                print("- API key is invalid or doesn't have permission")
+                out("- API key is invalid or doesn't have permission")
             elif "Timestamp" in response.text:
-                print("- Timestamp issue - local time is too different from server time")
-                print("  Try increasing recvWindow or check system clock")
+                out("- Timestamp issue - local time is too different from server time")
+                out("  Try increasing recvWindow or check system clock")
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        out(f"❌ Error: {str(e)}")
     
-    return
+    return "\n".join(lines)
 
-def test_futures_connection(api_key, api_secret, testnet=True):
-    """Test Binance Futures API connection"""
-    print("\n===== TESTING BINANCE FUTURES API =====")
+def test_futures_connection(session, sign, testnet=True):
+    """Test Binance Futures API connection; returns its report like test_spot_connection"""
+    lines = []
+    out = lines.append
+    out("\n===== TESTING BINANCE FUTURES API =====")
     
     if testnet:
         base_url = "https://testnet.binancefuture.com"
@@ -110,38 +113,38 @@ def test_futures_connection(api_key, api_secret, testnet=True):
         base_url = "https://fapi.binance.com"
     
     # 1. Get server time first to sync timestamps
-    print("\nGetting server time...")
+    out("\nGetting server time...")
     try:
-        response = requests.get(f"{base_url}/fapi/v1/time")
+        response = session.get(f"{base_url}/fapi/v1/time")
         if response.status_code == 200:
             server_time = response.json()['serverTime']
-            print(f"Server time: {server_time}")
+            out(f"Server time: {server_time}")
             
             # Calculate time difference
             local_time = int(time.time() * 1000)
             diff = local_time - server_time
-            print(f"Time difference: {diff}ms")
+            out(f"Time difference: {diff}ms")
         else:
-            print(f"Failed to get server time: {response.text}")
+            out(f"Failed to get server time: {response.text}")
             server_time = int(time.time() * 1000)
     except Exception as e:
-        print(f"Error getting server time: {str(e)}")
+        out(f"Error getting server time: {str(e)}")
         server_time = int(time.time() * 1000)
     
     # 2. Test public endpoint (no auth)
-    print("\nTesting public endpoint (price)...")
+    out("\nTesting public endpoint (price)...")
     try:
-        response = requests.get(f"{base_url}/fapi/v1/ticker/price?symbol=BTCUSDT")
+        response = session.get(f"{base_url}/fapi/v1/ticker/price?symbol=BTCUSDT")
         if response.status_code == 200:
             data = response.json()
-            print(f"✅ Success! BTC price: {data['price']}")
+            out(f"✅ Success! BTC price: {data['price']}")
         else:
-            print(f"❌ Failed: {response.status_code} - {response.text}")
+            out(f"❌ Failed: {response.status_code} - {response.text}")
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        out(f"❌ Error: {str(e)}")
     
     # 3. Test private endpoint (requires auth)
-    print("\nTesting private endpoint (account)...")
+    out("\nTesting private endpoint (account)...")
     timestamp = server_time - 500
     
     params = {
@@ -150,41 +153,34 @@ def test_futures_connection(api_key, api_secret, testnet=True):
     }
     
     query_string = '&'.join([f"{key}={params[key]}" for key in params])
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        query_string.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    signature = sign(query_string)
     
     url = f"{base_url}/fapi/v2/balance?{query_string}&signature={signature}"
-    headers = {
-        'X-MBX-APIKEY': api_key
-    }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = session.get(url)
         if response.status_code == 200:
             data = response.json()
             balances = {asset['asset']: float(asset['availableBalance']) for asset in data if float(asset['availableBalance']) > 0}
-            print(f"✅ Success! Account connected.")
-            print(f"Balances: {json.dumps(balances, indent=2)}")
+            out(f"✅ Success! Account connected.")
+            out(f"Balances: {json.dumps(balances, indent=2)}")
         else:
-            print(f"❌ Failed: {response.status_code} - {response.text}")
-            print("\nPossible issues:")
+            out(f"❌ Failed: {response.status_code} - {response.text}")
+            out("\nPossible issues:")
             if "API-key format invalid" in response.text:
-                print("- API key format is invalid")
+                out("- API key format is invalid")
             elif "Signature" in response.text:
-                print("- Signature is incorrect (API secret might be wrong)")
+                out("- Signature is incorrect (API secret might be wrong)")
             elif "Invalid API-key" in response.text:
-                print("- API key is invalid or doesn't have permission")
+                out("- API key is invalid or doesn't have permission")
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        out(f"❌ Error: {str(e)}")
     
     # 4. Test order placement
-    print("\nTesting market order placement (not executing)...")
-    print("Skipping actual order placement to prevent accidental trades")
+    out("\nTesting market order placement (not executing)...")
+    out("Skipping actual order placement to prevent accidental trades")
     
-    return
+    return "\n".join(lines)
 
 def test_database_keys():
     """Test keys stored in database"""
@@ -203,12 +199,13 @@ def test_database_keys():
         # Get all clients
         clients = session.query(Client).all()
         
-        print(f"Found {len(clients)} clients in database:")
+        lines = [f"Found {len(clients)} clients in database:"]
         for client in clients:
-            print(f"\nClient ID: {client.client_id}")
-            print(f"Testnet: {client.is_testnet}")
-            print(f"API Key: {client.api_key[:10]}...")
-            print(f"API Secret: {client.api_secret[:10]}...")
+            lines.append(f"\nClient ID: {client.client_id}")
+            lines.append(f"Testnet: {client.is_testnet}")
+            lines.append(f"API Key: {client.api_key[:10]}...")
+            lines.append(f"API Secret: {client.api_secret[:10]}...")
+        sys.stdout.write('\n'.join(lines) + '\n')
         
         session.close()
     except Exception as e:
@@ -224,9 +221,17 @@ def main():
         print(f"API Key: {api_key[:5]}...{api_key[-5:]}")
         print(f"API Secret: {api_secret[:5]}...{api_secret[-5:]}")
         
-        # Test both types of connections
-        test_spot_connection(api_key, api_secret, testnet=True)
-        test_futures_connection(api_key, api_secret, testnet=True)
+        # One keep-alive pool shared by both hosts; the API key header is set once here
+        with requests.Session() as session:
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+            session.headers.update({'X-MBX-APIKEY': api_key})
+            sign = make_signer(api_secret)
+            
+            # Test both types of connections; they hit different hosts, so run them together
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                spot = executor.submit(test_spot_connection, session, sign, testnet=True)
+                futures = executor.submit(test_futures_connection, session, sign, testnet=True)
+            sys.stdout.write(f"{spot.result()}\n{futures.result()}\n")
     else:
         print("No API keys provided, checking database...")
         test_database_keys()
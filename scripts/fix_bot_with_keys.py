@@ -9,6 +9,7 @@ import logging
 from datetime import datetime
 import time
 import math
+import threading
 import requests
 
 # Add project root to path
@@ -22,6 +23,10 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Order polling backs off between these bounds (seconds) while no order fills
+MIN_POLL_INTERVAL = 1
+MAX_POLL_INTERVAL = 30
+
 def round_to_precision(value, precision):
     """Round value to specific precision (decimal places)"""
     factor = 10 ** precision
@@ -76,6 +81,21 @@ def get_symbol_precision_info(symbol, testnet=True):
         logger.error(f"Error getting symbol precision: {str(e)}")
         return None
 
+def check_filled_orders(bot, exchange_client, pair):
+    """Hand tracked orders that left the open-order list to the bot; return True if any did"""
+    open_order_ids = {order['id'] for order in exchange_client.get_open_orders(pair)}
+    filled = False
+    for order_id, order_info in list(bot.active_positions.items()):
+        if order_id not in open_order_ids:
+            logger.info(f"Order {order_id} has been filled!")
+            bot.handle_order_fill(
+                order_id, 
+                float(order_info['price']), 
+                float(order_info['amount'])
+            )
+            filled = True
+    return filled
+
 def main():
     parser = argparse.ArgumentParser(description='Run grid bot with direct API keys')
     parser.add_argument('api_key', help='Binance API key')
@@ -141,53 +161,48 @@ def main():
     # Print the parameter list to debug
     logger.info(f"Creating GridBot with parameters:")
     logger.info(f"  bot_id: {bot_id}")
-    logger.info(f"  client: [exchange client object]")
-    logger.info(f"  pair: {args.pair}")
-    logger.info(f"  lower: {lower_price}")
-    logger.info(f"  upper: {upper_price}")
-    logger.info(f"  grids: {args.grids}")
+    logger.info(f"  exchange: [exchange client object]")
+    logger.info(f"  symbol: {args.pair}")
     logger.info(f"  capital: {args.capital}")
+    logger.info(f"  grid_count: {args.grids}")
+    logger.info(f"  range_percentage: {args.range_percentage}")
     
-    # Use CORRECT ORDER: bot_id, client, pair, lower, upper, grids, capital
     bot = GridBot(
-        bot_id,
-        exchange_client,
-        args.pair,
-        lower_price, 
-        upper_price, 
-        args.grids,
-        args.capital
+        exchange=exchange_client,
+        symbol=args.pair,
+        capital=args.capital,
+        grid_count=args.grids,
+        range_percentage=args.range_percentage
     )
     
     try:
         # Start grid bot
         logger.info(f"Starting bot with ID {bot_id} for {args.pair} with {args.capital} capital")
-        bot.start()
         
-        # Keep running until keyboard interrupt - but don't call check_orders since it doesn't exist
+        # GridBot.start() blocks in its own monitor loop, so it runs beside the fill check below
+        threading.Thread(target=bot.start, daemon=True).start()
+        
+        # Keep running until keyboard interrupt
         logger.info("Bot running. Press Ctrl+C to stop.")
         
-        # Implement a simple order monitoring loop
+        # Implement a simple order monitoring loop. Fills are rare between price
+        # touches, so the poll interval grows while nothing changes and drops
+        # back to the minimum after a fill
+        last_change = time.monotonic()
         while True:
             logger.info(f"Bot running... Current profit: {bot.calculate_profit()}")
             
             # Print active orders
-            logger.info(f"Active orders: {len(bot.active_orders)}")
-            for order_id, order_info in bot.active_orders.items():
+            logger.info(f"Active orders: {len(bot.active_positions)}")
+            for order_id, order_info in list(bot.active_positions.items()):
                 logger.info(f"  Order {order_id}: {order_info.get('side')} {order_info.get('amount')} @ {order_info.get('price')}")
             
             # Check if any orders have been filled
-            for order_id, order_info in list(bot.active_orders.items()):
-                order_status = exchange_client.get_order(args.pair, order_id)
-                if order_status and order_status.get('status') == 'filled':
-                    logger.info(f"Order {order_id} has been filled!")
-                    bot.handle_order_fill(
-                        order_id, 
-                        float(order_status['price']), 
-                        float(order_status['amount'])
-                    )
+            if check_filled_orders(bot, exchange_client, args.pair):
+                last_change = time.monotonic()
             
-            time.sleep(10)
+            idle = time.monotonic() - last_change
+            time.sleep(min(MAX_POLL_INTERVAL, max(MIN_POLL_INTERVAL, 2 * idle)))
             
     except KeyboardInterrupt:
         logger.info("Stopping bot...")
@@ -0,0 +1,29 @@
+import itertools
+import time
+import pytest
+from unittest.mock import Mock
+from common.bot.precision_grid_bot import PrecisionGridBot
+
+@pytest.fixture
+def mock_exchange():
+    exchange = Mock()
+    exchange.get_ticker.return_value = {'last': 20000.0}
+    exchange._get_public.return_value = {}  # no instrument info, use default precision
+    ids = itertools.count(1)
+    exchange.create_order.side_effect = lambda **kwargs: {'id': str(next(ids)), **kwargs}
+    return exchange
+
+def test_initialize_grid_respects_order_rate_limit(mock_exchange, monkeypatch):
+    """Test placement workers share the per-second order limit."""
+    monkeypatch.setenv('GRID_PARALLEL', '8')
+    monkeypatch.setenv('GRID_ORDERS_PER_SECOND', '2')
+    bot = PrecisionGridBot(mock_exchange, 'BTC/USDT', capital=1000.0, grid_count=4)
+    
+    started = time.monotonic()
+    bot.initialize_grid()
+    elapsed = time.monotonic() - started
+    
+    # 4 orders at 2 per second need a second window beyond the first
+    assert mock_exchange.create_order.call_count == 4
+    assert len(bot.active_positions) == 4
+    assert elapsed >= 1.0
@@ -56,4 +56,24 @@ def test_create_order(exchange_client, mock_ccxt):
         amount=0.1,
         price=20000.0
     )
-    assert order is None 
\ No newline at end of file
+    assert order is None 
+
+def test_cancel_all_orders(exchange_client, mock_ccxt):
+    """Test cancelling all orders uses the bulk endpoint when available."""
+    exchange = mock_ccxt.binance.return_value
+    
+    # Bulk endpoint supported
+    exchange.has = {'cancelAllOrders': True}
+    assert exchange_client.cancel_all_orders('BTC/USDT') is True
+    exchange.cancel_all_orders.assert_called_once_with('BTC/USDT')
+    exchange.cancel_order.assert_not_called()
+    
+    # Fallback to per-order cancels
+    exchange.has = {}
+    exchange.fetch_open_orders.return_value = [{'id': '1'}, {'id': '2'}]
+    assert exchange_client.cancel_all_orders('BTC/USDT') is True
+    assert exchange.cancel_order.call_count == 2
+    
+    # A failed cancel is reported
+    exchange.cancel_order.side_effect = Exception('API error')
+    assert exchange_client.cancel_all_orders('BTC/USDT') is False
@@ -0,0 +1,109 @@
+import io
+import json
+import time
+import pytest
+from unittest.mock import Mock, PropertyMock, patch
+from urllib.parse import parse_qs
+
+from common.exchange.futures_client import FuturesExchangeClient
+
+@pytest.fixture
+def futures_client():
+    with patch.object(FuturesExchangeClient, '_sync_time'):
+        client = FuturesExchangeClient('test_key', 'test_secret')
+    client._offset_refreshed_at = float('inf')
+    client._session = Mock()
+    return client
+
+def test_failed_time_sync_is_retried(futures_client):
+    """Test a failed clock sync keeps the old offset and retries on the next call."""
+    futures_client._offset_refreshed_at = None
+    futures_client._time_offset_ms = 1500
+    futures_client._session.get.side_effect = [
+        Mock(status_code=503, text='unavailable'),
+        ConnectionError('network down'),
+        Mock(status_code=200, content=json.dumps({'serverTime': 0}).encode()),
+    ]
+    
+    before = int(time.time() * 1000)
+    assert futures_client._get_timestamp() >= before + 1500
+    assert futures_client._offset_refreshed_at is None
+    
+    # A network error falls back to local time instead of failing the call
+    assert futures_client._get_timestamp() >= before + 1500
+    assert futures_client._offset_refreshed_at is None
+    
+    futures_client._get_timestamp()
+    assert futures_client._offset_refreshed_at is not None
+    assert futures_client._session.get.call_count == 3
+
+def test_create_orders_batches(futures_client):
+    """Test batch placement chunks orders and maps per-order results."""
+    def fake_post(url, data, headers):
+        batch = json.loads(parse_qs(data)['batchOrders'][0])
+        results = []
+        for i, order in enumerate(batch):
+            if order['price'] == '0':
+                results.append({'code': -1111, 'msg': 'Invalid price'})
+            else:
+                results.append({'orderId': i, 'origQty': order['quantity'], 'price': order['price'], 'status': 'NEW'})
+        return Mock(status_code=200, content=json.dumps(results).encode())
+    
+    futures_client._session.post.side_effect = fake_post
+    
+    orders = [{'symbol': 'BTC/USDT', 'side': 'buy', 'amount': 0.1, 'price': 20000.0 + i} for i in range(7)]
+    orders[6]['price'] = 0
+    results = futures_client.create_orders(orders)
+    
+    assert futures_client._session.post.call_count == 2
+    assert [r and r['price'] for r in results] == [20000.0, 20001.0, 20002.0, 20003.0, 20004.0, 20005.0, None]
+    assert results[0]['symbol'] == 'BTC/USDT'
+
+def test_get_open_orders(futures_client):
+    """Test open orders are converted to the common order schema."""
+    response = Mock(status_code=200, headers={'Content-Length': '200'})
+    response.content = json.dumps([
+        {'orderId': 7, 'symbol': 'BTCUSDT', 'side': 'SELL', 'origQty': '0.1', 'price': '21000', 'status': 'NEW'}
+    ]).encode()
+    futures_client._session.get.return_value.__enter__ = Mock(return_value=response)
+    futures_client._session.get.return_value.__exit__ = Mock(return_value=False)
+    
+    assert futures_client.get_open_orders('BTC/USDT') == [
+        {'id': '7', 'symbol': 'BTC/USDT', 'side': 'sell', 'amount': 0.1, 'price': 21000.0, 'status': 'new'}
+    ]
+
+def test_create_listen_key(futures_client):
+    """Test opening a user data stream returns its listen key."""
+    futures_client._session.post.return_value = Mock(status_code=200, content=b'{"listenKey": "abc123"}')
+    
+    assert futures_client.create_listen_key() == 'abc123'
+    assert futures_client._session.post.call_args.args[0].endswith('/fapi/v1/listenKey')
+
+def test_get_open_orders_streams_unsized_response(futures_client):
+    """Test a chunked response without Content-Length is parsed incrementally."""
+    pytest.importorskip('ijson')
+    
+    class ChunkedBody:
+        """Hands the body out a few bytes at a time, like a chunked transfer."""
+        decode_content = False
+        
+        def __init__(self, body):
+            self._body = io.BytesIO(body)
+        
+        def read(self, size=-1):
+            return self._body.read(16 if size < 0 else min(size, 16))
+    
+    body = json.dumps([
+        {'orderId': 7, 'symbol': 'BTCUSDT', 'side': 'SELL', 'origQty': '0.1', 'price': '21000', 'status': 'NEW'},
+        {'orderId': 8, 'symbol': 'BTCUSDT', 'side': 'BUY', 'origQty': '0.2', 'price': '19000.5', 'status': 'NEW'}
+    ]).encode()
+    response = Mock(status_code=200, headers={}, raw=ChunkedBody(body))
+    type(response).content = PropertyMock(side_effect=AssertionError('body should not be buffered'))
+    futures_client._session.get.return_value.__enter__ = Mock(return_value=response)
+    futures_client._session.get.return_value.__exit__ = Mock(return_value=False)
+    
+    assert futures_client.get_open_orders('BTC/USDT') == [
+        {'id': '7', 'symbol': 'BTC/USDT', 'side': 'sell', 'amount': 0.1, 'price': 21000.0, 'status': 'new'},
+        {'id': '8', 'symbol': 'BTC/USDT', 'side': 'buy', 'amount': 0.2, 'price': 19000.5, 'status': 'new'}
+    ]
+    assert response.raw.decode_content
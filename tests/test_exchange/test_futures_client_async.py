@@ -0,0 +1,40 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from common.exchange.futures_client_async import AsyncFuturesExchangeClient
+
+@pytest.fixture
+def async_client():
+    return AsyncFuturesExchangeClient('test_key', 'test_secret')
+
+@pytest.mark.asyncio
+async def test_create_orders_bulk(async_client):
+    """Test bulk placement preserves input order and reports failures as None."""
+    async def fake_create_order(symbol, side, amount, price):
+        if price < 0:
+            return None
+        return {'symbol': symbol, 'side': side, 'amount': amount, 'price': price}
+    
+    with patch.object(async_client, 'create_order', side_effect=fake_create_order):
+        results = await async_client.create_orders_bulk([
+            {'symbol': 'BTC/USDT', 'side': 'buy', 'amount': 0.1, 'price': 20000.0},
+            {'symbol': 'BTC/USDT', 'side': 'sell', 'amount': 0.1, 'price': -1.0},
+            {'symbol': 'BTC/USDT', 'side': 'sell', 'amount': 0.1, 'price': 21000.0},
+        ])
+    
+    assert [r and r['price'] for r in results] == [20000.0, None, 21000.0]
+    await async_client.close()
+
+@pytest.mark.asyncio
+async def test_get_timestamp_syncs_once(async_client):
+    """Test concurrent timestamp requests share a single clock sync."""
+    async def fake_sync_time():
+        await asyncio.sleep(0.01)
+        async_client._offset_refreshed_at = time.monotonic()
+    
+    with patch.object(async_client, '_sync_time', AsyncMock(side_effect=fake_sync_time)) as sync_time:
+        await asyncio.gather(*(async_client._get_timestamp() for _ in range(5)))
+    
+    assert sync_time.await_count == 1
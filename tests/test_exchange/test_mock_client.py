@@ -0,0 +1,33 @@
+import pytest
+from common.exchange.mock_client import MockExchangeClient
+
+@pytest.fixture
+def mock_exchange():
+    return MockExchangeClient('test_key', 'test_secret')
+
+def test_get_open_orders_by_symbol(mock_exchange):
+    """Test open orders are filtered by symbol."""
+    btc_order = mock_exchange.create_order('BTC/USDT', 'buy', 0.01, 80000.0)
+    eth_order = mock_exchange.create_order('ETH/USDT', 'buy', 0.1, 2000.0)
+    
+    btc_orders = mock_exchange.get_open_orders('BTC/USDT')
+    assert [o['id'] for o in btc_orders] == [btc_order['id']]
+    
+    all_ids = {o['id'] for o in mock_exchange.get_open_orders()}
+    assert all_ids == {btc_order['id'], eth_order['id']}
+    
+    assert mock_exchange.get_open_orders('SOL/USDT') == []
+
+def test_cancel_all_orders_releases_funds(mock_exchange):
+    """Test cancelling orders only touches the given symbol and unlocks funds."""
+    mock_exchange.create_order('BTC/USDT', 'buy', 0.01, 80000.0)
+    mock_exchange.create_order('BTC/USDT', 'sell', 0.01, 90000.0)
+    eth_order = mock_exchange.create_order('ETH/USDT', 'buy', 0.1, 2000.0)
+    
+    assert mock_exchange.cancel_all_orders('BTC/USDT')
+    
+    assert mock_exchange.get_open_orders('BTC/USDT') == []
+    assert [o['id'] for o in mock_exchange.get_open_orders()] == [eth_order['id']]
+    assert mock_exchange.balances['BTC']['free'] == pytest.approx(0.1)
+    assert mock_exchange.balances['BTC']['used'] == pytest.approx(0.0)
+    assert mock_exchange.balances['USDT']['used'] == pytest.approx(200.0)
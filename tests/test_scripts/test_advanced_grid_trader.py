@@ -0,0 +1,174 @@
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from common.exchange.futures_client import FuturesExchangeClient
+from common.exchange.futures_client_async import AsyncFuturesExchangeClient
+from scripts.advanced_grid_trader import GridTrader
+
+@pytest.fixture
+def exchange():
+    client = Mock(spec=FuturesExchangeClient)
+    with patch('scripts.advanced_grid_trader._shared_client', return_value=client):
+        yield client
+
+@pytest.fixture
+def trader(exchange):
+    """GridTrader with a 7-level ladder from 19900 to 20700, sized without network calls."""
+    trader = GridTrader('key', 'secret', 'BTC/USDT', capital=1000, grid_count=7)
+    trader.current_price = 20300.0
+    trader.lower_price, trader.upper_price = 19900.0, 20700.0
+    trader.price_step = 100.0
+    trader.tick_size, trader.step_size, trader.min_qty = 0.1, 0.001, 0.001
+    trader.min_notional = 100.0
+    trader.usdt_per_grid = 140.0
+    trader._levels = [trader._level(i) for i in range(trader.grid_count)]
+    return trader
+
+def fake_create_orders(orders):
+    """Accept every order, numbering them by price."""
+    return [{'id': str(int(order['price'])), 'price': order['price']} for order in orders]
+
+def test_create_grid_orders_uses_batches(trader, exchange):
+    """Test grid levels are placed through the batch endpoint in groups of MAX_BATCH_ORDERS."""
+    exchange.create_orders.side_effect = fake_create_orders
+    
+    assert trader.create_grid_orders()
+    
+    batches = [call.args[0] for call in exchange.create_orders.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [2, 5]
+    exchange.create_order.assert_not_called()
+    
+    assert len(trader.grid_orders) == 7
+    prices = sorted(order['price'] for order in trader.grid_orders.values())
+    assert prices == [20000.0, 20100.0, 20200.0, 20300.0, 20400.0, 20500.0, 20600.0]
+    assert trader.grid_orders['20000']['side'] == 'buy'
+    assert trader.grid_orders['20100']['side'] == 'sell'
+
+def test_create_grid_orders_skips_rejected_levels(trader, exchange):
+    """Test rejected levels and failed batches are not tracked."""
+    def create_orders(orders):
+        if len(orders) < 5:
+            raise Exception('timeout')
+        return [None] + fake_create_orders(orders[1:])
+    exchange.create_orders.side_effect = create_orders
+    
+    assert trader.create_grid_orders()
+    assert sorted(trader.grid_orders) == ['20100', '20200', '20300', '20400']
+
+@pytest.mark.asyncio
+async def test_monitor_orders_reads_through_async_client(trader, exchange):
+    """Test the reconcile pass fetches via the asyncio client and refills a vanished order."""
+    exchange.create_orders.side_effect = fake_create_orders
+    exchange.create_order.return_value = {'id': 'refill'}
+    trader.create_grid_orders()
+    
+    trader._async_exchange = AsyncMock(spec=AsyncFuturesExchangeClient)
+    trader._async_exchange.get_ticker.return_value = 20350.0
+    trader._async_exchange.get_open_orders.return_value = [
+        {'id': order_id, 'side': order['side'], 'amount': order['amount'], 'price': order['price']}
+        for order_id, order in trader.grid_orders.items() if order_id != '20600'
+    ]
+    
+    with patch('scripts.advanced_grid_trader.get_account_positions', return_value=[]) as positions:
+        await trader.monitor_orders()
+    
+    trader._async_exchange.get_open_orders.assert_awaited_once_with('BTC/USDT')
+    positions.assert_called_once()
+    assert trader.current_price == 20350.0
+    assert [order['id'] for order in trader.filled_orders] == ['20600']
+    assert 'refill' in trader.grid_orders and len(trader.grid_orders) == 7
+
+def test_stream_events_are_handled_on_event_worker(trader, exchange):
+    """Test queued fill and position events are applied by the worker thread."""
+    exchange.create_orders.side_effect = fake_create_orders
+    exchange.create_order.return_value = {'id': 'refill'}
+    trader.create_grid_orders()
+    trader.running = True
+    
+    for event in (
+        {'e': 'markPriceUpdate', 'p': '20450.0'},
+        {'e': 'ORDER_TRADE_UPDATE', 'o': {'X': 'FILLED', 'i': 20000}},
+        {'e': 'ACCOUNT_UPDATE', 'a': {'P': [{'s': 'BTCUSDT', 'ps': 'BOTH', 'pa': '0.007', 'ep': '20000', 'up': '3.1'}]}},
+        None
+    ):
+        trader._events.put(event)
+    trader._process_events()
+    
+    assert trader.current_price == 20450.0
+    assert [order['id'] for order in trader.filled_orders] == ['20000']
+    assert 'refill' in trader.grid_orders
+    assert trader.active_positions == [
+        {'symbol': 'BTCUSDT', 'positionSide': 'BOTH', 'positionAmt': '0.007', 'entryPrice': '20000', 'unRealizedProfit': '3.1'}
+    ]
+
+def track(trader, order_id, price):
+    trader._track_grid_order({'id': order_id, 'side': 'buy', 'price': price, 'amount': 0.007, 'notional': 140.0})
+
+def test_price_aggregates_skip_removed_orders(trader):
+    """Test the lazy heaps and running sum follow orders as they are taken."""
+    for order_id, price in (('a', 20100.0), ('b', 20300.0), ('c', 20500.0)):
+        track(trader, order_id, price)
+    assert (trader._lowest_price(), trader._highest_price()) == (20100.0, 20500.0)
+    assert trader._price_sum == pytest.approx(60900.0)
+    
+    trader._take_grid_order('a')
+    trader._take_grid_order('c')
+    assert (trader._lowest_price(), trader._highest_price()) == (20300.0, 20300.0)
+    assert trader._price_sum == pytest.approx(20300.0)
+    
+    assert trader._take_grid_order('missing') is None
+    trader._take_grid_order('b')
+    assert trader._price_sum == 0.0
+    assert [order['id'] for order in trader.filled_orders] == ['a', 'c', 'b']
+
+def test_rebalance_grid_extends_ladder_toward_price(trader, exchange):
+    """Test refills go one ladder step past the extreme on the side the price moved to."""
+    exchange.create_order.side_effect = [{'id': 'low'}, {'id': 'high'}]
+    trader.grid_count = 4
+    for order_id, price in (('a', 20100.0), ('b', 20200.0), ('c', 20300.0)):
+        track(trader, order_id, price)
+    
+    trader.rebalance_grid(20000.0)
+    exchange.create_order.assert_called_with(symbol='BTC/USDT', side='buy', amount=trader._level(0)[1], price=20000.0)
+    assert trader.grid_orders['low']['grid_index'] == 0
+    
+    trader._take_grid_order('low')
+    trader.rebalance_grid(20600.0)
+    exchange.create_order.assert_called_with(symbol='BTC/USDT', side='sell', amount=trader._level(4)[1], price=20400.0)
+    assert trader.grid_orders['high']['grid_index'] == 4
+
+def test_rebalance_grid_recenters_empty_grid(trader, exchange):
+    """Test an empty grid is rebuilt around the current price."""
+    exchange.create_order.return_value = {'id': 'buy'}
+    trader.grid_count = 1
+    
+    trader.rebalance_grid(20000.0)
+    
+    exchange.create_order.assert_called_once_with(symbol='BTC/USDT', side='buy', amount=trader._level(0)[1], price=20000.0)
+    assert trader.grid_orders['buy']['grid_index'] == 0
+
+def test_stop_cancels_orders_and_drains_worker(trader, exchange):
+    """Test stop() joins the event worker and cancels everything for the symbol."""
+    trader.running = True
+    trader._event_worker = Mock()
+    
+    trader.stop()
+    
+    assert not trader.running
+    assert trader._events.get_nowait() is None
+    exchange.cancel_all_orders.assert_called_once_with('BTC/USDT')
+
+def test_stop_does_not_wait_on_slow_cancel(trader, exchange):
+    """Test a hung cancel request only holds stop() for CANCEL_TIMEOUT."""
+    release = threading.Event()
+    exchange.cancel_all_orders.side_effect = lambda symbol: release.wait(5)
+    trader.CANCEL_TIMEOUT = 0.05
+    
+    started = time.monotonic()
+    trader.stop()
+    release.set()
+    
+    assert time.monotonic() - started < 1
+    exchange.cancel_all_orders.assert_called_once()
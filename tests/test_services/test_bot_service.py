@@ -1,3 +1,4 @@
+import time
 import pytest
 from unittest.mock import Mock, patch
 from common.services.bot_service import BotService
@@ -21,6 +22,12 @@ def mock_grid_bot():
 def bot_service():
     return BotService()
 
+@pytest.fixture
+def offline_bot_service():
+    """BotService with the network-bound price monitor patched out."""
+    with patch('common.services.bot_service.PriceMonitor'):
+        yield BotService()
+
 def test_start_bot(bot_service, mock_exchange, mock_grid_bot):
     """Test starting a bot."""
     # Create test data
@@ -87,17 +94,80 @@ def test_handle_order_fill(bot_service, mock_exchange, mock_grid_bot, test_sessi
     # Start bot first
     bot_service.start_bot(bot, client)
     
-    # Setup mock for profit calculation
-    mock_grid_bot.return_value.calculate_profit.return_value = 0.001
+    # Setup the running profit total the bot reports after the fill
+    mock_grid_bot.return_value.realized_profit = 0.001
     
     # Test successful order fill
     assert bot_service.handle_order_fill(1, 'test_order', 20100.0, 0.1, test_session)
     
-    # Verify trade was recorded
+    # Verify trade was recorded once the batch is committed
+    bot_service.flush_trades()
     trade = test_session.query(Trade).filter_by(bot_id=1).first()
     assert trade is not None
     assert trade.amount_btc == 0.1
     assert trade.profit_btc == 0.001
     
     # Test handling fill for non-existent bot
-    assert not bot_service.handle_order_fill(999, 'test_order', 20100.0, 0.1, test_session) 
\ No newline at end of file
+    assert not bot_service.handle_order_fill(999, 'test_order', 20100.0, 0.1, test_session)
+
+def test_price_ticks_fan_out_to_bots_on_pair(offline_bot_service, mock_exchange, mock_grid_bot):
+    """Test one price tick reaches every bot trading the pair."""
+    client = Client(client_id=1, api_key='test', api_secret='test')
+    first_bot, second_bot = Mock(spec=GridBot), Mock(spec=GridBot)
+    mock_grid_bot.side_effect = [first_bot, second_bot]
+    
+    for bot_id in (1, 2):
+        bot = Bot(
+            bot_id=bot_id,
+            client_id=1,
+            pair='BTC/USDT',
+            status='configured',
+            lower_price=20000,
+            upper_price=25000,
+            grids=5,
+            capital_btc=1.0
+        )
+        assert offline_bot_service.start_bot(bot, client)
+    
+    offline_bot_service._dispatch_tick('BTC/USDT', 21000.0)
+    first_bot.on_price.assert_called_once_with(21000.0)
+    second_bot.on_price.assert_called_once_with(21000.0)
+    
+    # Stopped bots no longer receive ticks
+    offline_bot_service.stop_bot(1)
+    offline_bot_service._dispatch_tick('BTC/USDT', 21500.0)
+    assert first_bot.on_price.call_count == 1
+    second_bot.on_price.assert_called_with(21500.0)
+
+def test_lone_fill_is_committed_by_timer(offline_bot_service):
+    """Test a buffered fill is committed without waiting for another fill."""
+    offline_bot_service.trade_commit_interval = 0.05
+    offline_bot_service.active_bots = {1: Mock(spec=GridBot, realized_profit=0.001)}
+    timer_session = Mock()
+    
+    with patch('common.services.bot_service.connection.get_session', return_value=timer_session):
+        assert offline_bot_service.handle_order_fill(1, 'test_order', 20100.0, 0.1, Mock())
+        time.sleep(0.3)
+    
+    assert offline_bot_service._pending_trades == []
+    timer_session.commit.assert_called_once()
+    timer_session.close.assert_called_once()
+
+def test_failed_commit_keeps_trades_buffered(offline_bot_service):
+    """Test trades survive a failed commit and go out with the next flush."""
+    offline_bot_service.trade_commit_interval = 60
+    offline_bot_service.active_bots = {1: Mock(spec=GridBot, realized_profit=0.001)}
+    session = Mock()
+    session.commit.side_effect = [Exception('db down'), None]
+    
+    assert offline_bot_service.handle_order_fill(1, 'first', 20100.0, 0.1, session)
+    assert offline_bot_service.handle_order_fill(1, 'second', 20200.0, 0.2, session)
+    assert not offline_bot_service.flush_trades()
+    session.rollback.assert_called_once()
+    assert len(offline_bot_service._pending_trades) == 2
+    
+    assert offline_bot_service.flush_trades()
+    assert offline_bot_service._pending_trades == []
+    committed = session.add_all.call_args[0][0]
+    assert [trade.amount_btc for trade in committed] == [0.1, 0.2]
+    offline_bot_service.cleanup()
@@ -1,5 +1,5 @@
 import pytest
-from common.utils.config import get_config
+from common.utils.config import get_config, get_env_config
 
 def test_config_loading(setup_test_env):
     """Test that configuration can be loaded properly."""
@@ -7,4 +7,22 @@ def test_config_loading(setup_test_env):
     assert config is not None
     assert 'database' in config
     assert 'url' in config['database']
-    assert config['database']['url'] == "sqlite:///:memory:" 
\ No newline at end of file
+    assert config['database']['url'] == "sqlite:///:memory:" 
+
+def test_config_mutation_does_not_leak(setup_test_env):
+    """Test that changes to a returned config do not reach the cached copy."""
+    config = get_config()
+    config['database']['url'] = "postgresql://changed"
+    config['extra'] = True
+    
+    fresh = get_config()
+    assert fresh['database']['url'] == "sqlite:///:memory:"
+    assert 'extra' not in fresh
+
+def test_env_config_is_read_only():
+    """Test that neither the env config nor its sections can be modified."""
+    config = get_env_config()
+    with pytest.raises(TypeError):
+        config['database'] = {}
+    with pytest.raises(TypeError):
+        config['database']['url'] = "postgresql://changed"
@@ -0,0 +1,22 @@
+import hashlib
+import hmac
+
+from common.utils.signing import make_signer, verify_signature
+
+def test_make_signer_matches_hmac_sha256():
+    """Test the cached signer produces the plain HMAC-SHA256 hex digest."""
+    sign = make_signer("secret")
+    for message in ("timestamp=1", "symbol=BTCUSDT&timestamp=2"):
+        expected = hmac.new(b"secret", message.encode('utf-8'), hashlib.sha256).hexdigest()
+        assert sign(message) == expected
+
+def test_make_signer_is_reusable():
+    """Test signing does not mutate the shared prototype."""
+    sign = make_signer("secret")
+    assert sign("a=1") == sign("a=1")
+
+def test_verify_signature():
+    """Test signatures are checked against the signer's output."""
+    sign = make_signer("secret")
+    assert verify_signature(sign, "a=1", sign("a=1"))
+    assert not verify_signature(sign, "a=1", sign("a=2"))
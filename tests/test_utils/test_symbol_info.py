@@ -0,0 +1,48 @@
+from common.utils.symbol_info import _with_formats, adjust_price, adjust_quantity
+
+def make_info(qty_step=0.001, price_step=0.5, min_qty=0.001):
+    return _with_formats({
+        "symbol": "BTCUSDT",
+        "min_qty": min_qty,
+        "qty_step": qty_step,
+        "min_price": price_step,
+        "price_step": price_step
+    })
+
+def test_adjust_quantity_rounds_half_steps_down():
+    """Test quantities halfway between steps are floored, not rounded to even."""
+    info = make_info(qty_step=0.001)
+    assert adjust_quantity(0.0025, info) == "0.002"
+    assert adjust_quantity(0.0035, info) == "0.003"
+    assert adjust_quantity(0.0019999, info) == "0.001"
+
+def test_adjust_quantity_keeps_exact_multiples():
+    """Test exact step multiples survive float representation error."""
+    info = make_info(qty_step=0.1, min_qty=0.1)
+    assert adjust_quantity(0.3, info) == "0.3"
+    assert adjust_quantity(0.7, info) == "0.7"
+    assert adjust_quantity(1.1, info) == "1.1"
+
+def test_adjust_quantity_enforces_minimum():
+    """Test quantities below the minimum are raised to it."""
+    info = make_info(qty_step=0.001, min_qty=0.005)
+    assert adjust_quantity(0.0001, info) == "0.005"
+
+def test_adjust_price_rounds_half_steps_down():
+    """Test prices halfway between ticks are floored."""
+    info = make_info(price_step=0.5)
+    assert adjust_price(100.25, info) == "100.0"
+    assert adjust_price(100.75, info) == "100.5"
+
+def test_adjust_price_keeps_exact_multiples():
+    """Test prices already on a tick are unchanged."""
+    info = make_info(price_step=0.01)
+    assert adjust_price(20000.0, info) == "20000.00"
+    assert adjust_price(0.29, info) == "0.29"
+    assert adjust_price(1.15, info) == "1.15"
+
+def test_adjust_without_precomputed_fields():
+    """Test adjustments still work on symbol info built without _with_formats."""
+    info = {"min_qty": 0.001, "qty_step": 0.001, "price_step": 0.5}
+    assert adjust_quantity(0.0025, info) == "0.002"
+    assert adjust_price(100.25, info) == "100.0"